@@ -107,7 +107,8 @@ Schema Reviewer (otto):
 
 Execution Flow:
 ===============
-1. Connect to Infrahub
+1. Connect to Infrahub (one client and one HTTP connection pool for the whole run)
+   and load the IDs of all existing permissions, roles, groups, and users
 2. Ensure permissions exist (create if missing)
 3. Create roles and link to permissions
 4. Create groups and link to roles
@@ -172,8 +173,95 @@ After running this script, you can test the RBAC setup:
 
 import asyncio
 import sys
+from typing import Any
 
-from infrahub_sdk import InfrahubClient
+import httpx
+from infrahub_sdk import Config, InfrahubClient
+from infrahub_sdk.exceptions import ServerNotReachableError, ServerNotResponsiveError
+from infrahub_sdk.types import AsyncRequester, HTTPMethod
+
+# ============================================================================
+# HTTP CONNECTION POOL
+# ============================================================================
+# By default the SDK opens a new httpx client (and TCP/TLS session) for every
+# request. This script issues many small queries and mutations in a row, so a
+# single keep-alive pool is shared by every step instead.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+
+# Upper bound on requests in flight at once. Batched saves and cached lookups
+# overlap requests; this keeps a large setup from flooding the API server.
+MAX_CONCURRENT_REQUESTS = 10
+
+
+def pooled_http_client(config: Config) -> httpx.AsyncClient:
+    """
+    Build the shared httpx pool with the SDK Config's TLS and proxy settings.
+
+    The SDK's default requester applies the Config's TLS context (custom CA,
+    tls_insecure) and proxy settings to every client it opens; the shared
+    pool applies the same ones.
+
+    Args:
+        config: SDK Config, including settings read from INFRAHUB_* variables
+
+    Returns:
+        httpx.AsyncClient with the shared connection pool limits
+    """
+    proxy: str | None = None
+    mounts: dict[str, httpx.AsyncHTTPTransport] | None = None
+    if config.proxy:
+        proxy = config.proxy
+    elif config.proxy_mounts.is_set:
+        mounts = {
+            key: httpx.AsyncHTTPTransport(proxy=value)
+            for key, value in config.proxy_mounts.model_dump(by_alias=True).items()
+        }
+
+    return httpx.AsyncClient(
+        limits=HTTP_LIMITS, verify=config.tls_context, proxy=proxy, mounts=mounts
+    )
+
+
+def pooled_requester(http_client: httpx.AsyncClient) -> AsyncRequester:
+    """
+    Build an SDK requester that sends every request through a shared httpx pool.
+
+    The returned coroutine matches the SDK's AsyncRequester protocol and maps
+    httpx transport errors to the same SDK exceptions as the default requester.
+    Every request goes through one semaphore, so no more than
+    MAX_CONCURRENT_REQUESTS are in flight regardless of how callers fan out.
+
+    Args:
+        http_client: Long-lived httpx.AsyncClient owning the connection pool
+
+    Returns:
+        Requester suitable for Config(requester=...)
+    """
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def request(
+        url: str,
+        method: HTTPMethod,
+        headers: dict[str, Any],
+        timeout: int,
+        payload: dict | None = None,
+    ) -> httpx.Response:
+        try:
+            async with semaphore:
+                return await http_client.request(
+                    method=method.value,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                    json=payload,
+                )
+        except httpx.NetworkError as exc:
+            raise ServerNotReachableError(address=url) from exc
+        except httpx.ReadTimeout as exc:
+            raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
+
+    return request
 
 # ============================================================================
 # PERMISSION LOOKUP UTILITIES
@@ -303,12 +391,134 @@ async def find_permission_by_identifier(
     return None
 
 
+async def cached_find_permission(
+    client: InfrahubClient,
+    identifier: str,
+    lookups: dict[str, asyncio.Future[str | None]],
+) -> str | None:
+    """
+    Memoized wrapper around find_permission_by_identifier().
+
+    Used for permissions the prefetched ID table doesn't know about. The
+    first caller for an identifier starts the query; every later caller
+    awaits the same future, whether it is still in flight or already done.
+
+    Args:
+        client: Authenticated InfrahubClient instance
+        identifier: Permission identifier string (e.g., "global:manage_schema:allow_all")
+        lookups: Identifier -> lookup future cache, created once per run
+
+    Returns:
+        Permission UUID if found, None if not found
+    """
+    if identifier not in lookups:
+        lookups[identifier] = asyncio.ensure_future(
+            find_permission_by_identifier(client, identifier)
+        )
+    return await lookups[identifier]
+
+
+# ============================================================================
+# ID PREFETCH
+# ============================================================================
+# One query loads the IDs of every object kind this script manages, so the
+# creation steps below check existence against an in-memory table instead of
+# issuing one lookup per permission, role, group, and user.
+
+PREFETCH_QUERY = """
+query {
+  CoreObjectPermission {
+    edges { node { id namespace { value } name { value } action { value } decision { value } } }
+  }
+  CoreGlobalPermission {
+    edges { node { id action { value } decision { value } } }
+  }
+  CoreAccountRole {
+    edges { node { id name { value } } }
+  }
+  CoreAccountGroup {
+    edges { node { id name { value } } }
+  }
+  CoreAccount {
+    edges { node { id name { value } } }
+  }
+}
+"""
+
+# Infrahub's integer decision values and their identifier spelling
+DECISION_NAMES: dict[int, str] = {1: "deny", 2: "allow_default", 4: "allow_other", 6: "allow_all"}
+
+
+def permission_identifier(kind: str, data: dict[str, Any]) -> str:
+    """
+    Build the identifier string for a permission from its attribute values.
+
+    Args:
+        kind: CoreGlobalPermission or CoreObjectPermission
+        data: Permission attributes (action, decision, and for object
+            permissions namespace and name)
+
+    Returns:
+        Identifier such as "global:manage_schema:allow_all" or
+        "object:*:*:view:allow_all"
+    """
+    decision_str = DECISION_NAMES.get(data["decision"], "allow_all")
+    if kind == "CoreGlobalPermission":
+        return f"global:{data['action']}:{decision_str}"
+    return f"object:{data['namespace']}:{data['name']}:{data['action']}:{decision_str}"
+
+
+def permission_kind(identifier: str) -> str:
+    """
+    Return the permission kind encoded in an identifier string.
+
+    Args:
+        identifier: Permission identifier string
+
+    Returns:
+        CoreGlobalPermission or CoreObjectPermission
+    """
+    if identifier.startswith("global:"):
+        return "CoreGlobalPermission"
+    return "CoreObjectPermission"
+
+
+async def prefetch_all(client: InfrahubClient) -> dict[tuple[str, str], str]:
+    """
+    Load the IDs of all existing permissions, roles, groups, and users.
+
+    Args:
+        client: Authenticated InfrahubClient instance
+
+    Returns:
+        Dictionary mapping (kind, name) to UUID. Permissions are keyed by
+        their identifier string, everything else by its name.
+    """
+    result = await client.execute_graphql(query=PREFETCH_QUERY)
+
+    ids: dict[tuple[str, str], str] = {}
+    for kind in ("CoreObjectPermission", "CoreGlobalPermission"):
+        for edge in result.get(kind, {}).get("edges", []):
+            node = edge["node"]
+            data = {attr: value["value"] for attr, value in node.items() if attr != "id"}
+            ids[(kind, permission_identifier(kind, data))] = node["id"]
+
+    for kind in ("CoreAccountRole", "CoreAccountGroup", "CoreAccount"):
+        for edge in result.get(kind, {}).get("edges", []):
+            node = edge["node"]
+            ids[(kind, node["name"]["value"])] = node["id"]
+
+    return ids
+
+
 # ============================================================================
 # PERMISSION CREATION
 # ============================================================================
 
 
-async def ensure_permissions_exist(client: InfrahubClient) -> None:
+async def ensure_permissions_exist(
+    client: InfrahubClient, ids: dict[tuple[str, str], str]
+) -> None:
     """
     Ensure all required permissions exist in Infrahub before creating roles.
 
@@ -336,6 +546,7 @@ async def ensure_permissions_exist(client: InfrahubClient) -> None:
 
     Args:
         client: Authenticated InfrahubClient instance
+        ids: ID table from prefetch_all(); created permissions are added to it
 
     Returns:
         None (prints status messages to stdout)
@@ -373,38 +584,39 @@ async def ensure_permissions_exist(client: InfrahubClient) -> None:
     # ========================================================================
     # Create Each Permission (with idempotency)
     # ========================================================================
+    # Missing permissions are staged here and saved together in one batch;
+    # failures are returned per task so one conflict doesn't abort the rest
+    save_batch = await client.create_batch(return_exceptions=True)
+    pending: dict[str, Any] = {}
+
     for kind, data in permissions_to_create:
         # Build identifier string for the permission
         # This is used to check if it already exists
-        if kind == "CoreGlobalPermission":
-            identifier = f"global:{data['action']}:allow_all"
-        else:
-            # Map integer decision values to string representation
-            decision_map: dict[int, str] = {1: "deny", 6: "allow_all"}
-            decision_value = data["decision"]
-            assert isinstance(decision_value, int), "decision must be an integer"
-            decision_str = decision_map.get(decision_value, "allow_all")
-            identifier = f"object:{data['namespace']}:{data['name']}:{data['action']}:{decision_str}"
+        identifier = permission_identifier(kind, data)
 
         # Check if permission already exists in Infrahub
-        existing = await find_permission_by_identifier(client, identifier)
-        if existing:
+        if (kind, identifier) in ids:
             print(f"  Permission {identifier} already exists")
         else:
-            # Permission doesn't exist - create it
-            try:
-                perm = await client.create(kind=kind, data=data)
-                await perm.save()
-                print(f"  Created permission {identifier}")
-            except Exception as e:
-                # Handle uniqueness constraint violations gracefully
-                # This can occur if permission was created between our check and create attempt
-                error_msg = str(e)
-                if "uniqueness constraint" in error_msg.lower():
-                    print(f"  Permission {identifier} already exists (uniqueness constraint)")
-                else:
-                    # Other errors are printed but don't halt execution
-                    print(f"  Failed to create permission {identifier}: {e}")
+            # Permission doesn't exist - stage it for creation
+            perm = await client.create(kind=kind, data=data)
+            pending[identifier] = perm
+            save_batch.add(task=perm.save, node=identifier)
+
+    async for identifier, result in save_batch.execute():
+        if not isinstance(result, Exception):
+            ids[(permission_kind(identifier), identifier)] = pending[identifier].id
+            print(f"  Created permission {identifier}")
+            continue
+
+        # Handle uniqueness constraint violations gracefully
+        # This can occur if permission was created between our check and create attempt
+        error_msg = str(result)
+        if "uniqueness constraint" in error_msg.lower():
+            print(f"  Permission {identifier} already exists (uniqueness constraint)")
+        else:
+            # Other errors are printed but don't halt execution
+            print(f"  Failed to create permission {identifier}: {result}")
 
 
 # ============================================================================
@@ -412,7 +624,11 @@ async def ensure_permissions_exist(client: InfrahubClient) -> None:
 # ============================================================================
 
 
-async def create_roles(client: InfrahubClient) -> dict[str, str]:
+async def create_roles(
+    client: InfrahubClient,
+    ids: dict[tuple[str, str], str],
+    permission_lookups: dict[str, asyncio.Future[str | None]],
+) -> dict[str, str]:
     """
     Create roles and return a mapping of role names to UUIDs.
 
@@ -444,13 +660,16 @@ async def create_roles(client: InfrahubClient) -> dict[str, str]:
 
     Args:
         client: Authenticated InfrahubClient instance
+        ids: ID table from prefetch_all()
+        permission_lookups: Per-run cache for permission lookups that miss ids
 
     Returns:
         Dictionary mapping role names to UUIDs
         Example: {"read-only-role": "uuid-123", "schema-reviewer-role": "uuid-456"}
 
     Example:
-        >>> role_ids = await create_roles(client)
+        >>> ids = await prefetch_all(client)
+        >>> role_ids = await create_roles(client, ids, {})
         >>> print(role_ids["read-only-role"])
         "a1b2c3d4-e5f6-..."
     """
@@ -460,7 +679,8 @@ async def create_roles(client: InfrahubClient) -> dict[str, str]:
     # Define Role Configurations
     # ========================================================================
     # Each role maps to a list of permission identifiers
-    # These identifiers are resolved to UUIDs using find_permission_by_identifier()
+    # These identifiers are resolved to UUIDs from the prefetched ID table,
+    # falling back to cached_find_permission()
     roles_config = {
         # Read-only role: View everything, modify nothing
         "read-only-role": [
@@ -480,6 +700,9 @@ async def create_roles(client: InfrahubClient) -> dict[str, str]:
     # Dictionary to store role name → UUID mappings
     role_ids = {}
 
+    # New roles are saved together once every existence check is done
+    save_batch = await client.create_batch()
+
     # ========================================================================
     # Create Each Role
     # ========================================================================
@@ -488,7 +711,11 @@ async def create_roles(client: InfrahubClient) -> dict[str, str]:
         # Permissions must exist before we can reference them in roles
         permission_ids = []
         for perm_id in permission_identifiers:
-            perm_uuid = await find_permission_by_identifier(client, perm_id)
+            # Permissions missing from the table (e.g. lost a creation race)
+            # fall back to a direct lookup
+            perm_uuid = ids.get(
+                (permission_kind(perm_id), perm_id)
+            ) or await cached_find_permission(client, perm_id, permission_lookups)
             if perm_uuid:
                 permission_ids.append(perm_uuid)
             else:
@@ -496,35 +723,23 @@ async def create_roles(client: InfrahubClient) -> dict[str, str]:
                 print(f"  Error: Permission {perm_id} not found after creation attempt!")
 
         # Check if role already exists in Infrahub
-        query = f"""
-        query {{
-          CoreAccountRole(name__value: "{role_name}") {{
-            edges {{
-              node {{
-                id
-              }}
-            }}
-          }}
-        }}
-        """
+        role_id = ids.get(("CoreAccountRole", role_name))
 
-        result = await client.execute_graphql(query=query)
-        edges = result.get("CoreAccountRole", {}).get("edges", [])
-
-        if edges:
+        if role_id:
             # Role already exists - use existing UUID
-            role_id = edges[0]["node"]["id"]
             print(f"  Role '{role_name}' already exists (ID: {role_id})")
             role_ids[role_name] = role_id
         else:
-            # Role doesn't exist - create it with linked permissions
+            # Role doesn't exist - stage it with linked permissions
             role = await client.create(
                 kind="CoreAccountRole",
                 data={"name": role_name, "permissions": permission_ids},
             )
-            await role.save()
-            print(f"  Created role '{role_name}' (ID: {role.id})")
-            role_ids[role_name] = role.id
+            save_batch.add(task=role.save, node=role)
+
+    async for role, _ in save_batch.execute():
+        print(f"  Created role '{role.name.value}' (ID: {role.id})")
+        role_ids[role.name.value] = role.id
 
     return role_ids
 
@@ -535,7 +750,9 @@ async def create_roles(client: InfrahubClient) -> dict[str, str]:
 
 
 async def create_groups(
-    client: InfrahubClient, role_ids: dict[str, str]
+    client: InfrahubClient,
+    ids: dict[tuple[str, str], str],
+    role_ids: dict[str, str],
 ) -> dict[str, str]:
     """
     Create groups and return a mapping of group names to UUIDs.
@@ -569,6 +786,7 @@ async def create_groups(
 
     Args:
         client: Authenticated InfrahubClient instance
+        ids: ID table from prefetch_all()
         role_ids: Dict mapping role names to UUIDs (from create_roles())
 
     Returns:
@@ -576,8 +794,9 @@ async def create_groups(
         Example: {"read-only-users": "uuid-123", "schema-reviewers": "uuid-456"}
 
     Example:
-        >>> role_ids = await create_roles(client)
-        >>> group_ids = await create_groups(client, role_ids)
+        >>> ids = await prefetch_all(client)
+        >>> role_ids = await create_roles(client, ids, {})
+        >>> group_ids = await create_groups(client, ids, role_ids)
         >>> print(group_ids["read-only-users"])
         "a1b2c3d4-e5f6-..."
     """
@@ -602,6 +821,9 @@ async def create_groups(
     # Dictionary to store group name → UUID mappings
     group_ids = {}
 
+    # New groups are saved together once every existence check is done
+    save_batch = await client.create_batch()
+
     # ========================================================================
     # Create Each Group
     # ========================================================================
@@ -611,28 +833,14 @@ async def create_groups(
         role_id_list = [role_ids[role_name] for role_name in config["roles"]]
 
         # Check if group already exists in Infrahub
-        query = f"""
-        query {{
-          CoreAccountGroup(name__value: "{group_name}") {{
-            edges {{
-              node {{
-                id
-              }}
-            }}
-          }}
-        }}
-        """
+        group_id = ids.get(("CoreAccountGroup", group_name))
 
-        result = await client.execute_graphql(query=query)
-        edges = result.get("CoreAccountGroup", {}).get("edges", [])
-
-        if edges:
+        if group_id:
             # Group already exists - use existing UUID
-            group_id = edges[0]["node"]["id"]
             print(f"  Group '{group_name}' already exists (ID: {group_id})")
             group_ids[group_name] = group_id
         else:
-            # Group doesn't exist - create it with linked roles
+            # Group doesn't exist - stage it with linked roles
             group = await client.create(
                 kind="CoreAccountGroup",
                 data={
@@ -641,9 +849,11 @@ async def create_groups(
                     "roles": role_id_list,
                 },
             )
-            await group.save()
-            print(f"  Created group '{group_name}' (ID: {group.id})")
-            group_ids[group_name] = group.id
+            save_batch.add(task=group.save, node=group)
+
+    async for group, _ in save_batch.execute():
+        print(f"  Created group '{group.name.value}' (ID: {group.id})")
+        group_ids[group.name.value] = group.id
 
     return group_ids
 
@@ -653,7 +863,11 @@ async def create_groups(
 # ============================================================================
 
 
-async def create_users(client: InfrahubClient, group_ids: dict[str, str]) -> None:
+async def create_users(
+    client: InfrahubClient,
+    ids: dict[tuple[str, str], str],
+    group_ids: dict[str, str],
+) -> None:
     """
     Create user accounts with group memberships.
 
@@ -688,15 +902,17 @@ async def create_users(client: InfrahubClient, group_ids: dict[str, str]) -> Non
 
     Args:
         client: Authenticated InfrahubClient instance
+        ids: ID table from prefetch_all()
         group_ids: Dict mapping group names to UUIDs (from create_groups())
 
     Returns:
         None (prints status messages to stdout)
 
     Example:
-        >>> role_ids = await create_roles(client)
-        >>> group_ids = await create_groups(client, role_ids)
-        >>> await create_users(client, group_ids)
+        >>> ids = await prefetch_all(client)
+        >>> role_ids = await create_roles(client, ids, {})
+        >>> group_ids = await create_groups(client, ids, role_ids)
+        >>> await create_users(client, ids, group_ids)
         Creating users...
           Created user 'emma' (ID: uuid-123)
           Created user 'otto' (ID: uuid-456)
@@ -723,6 +939,9 @@ async def create_users(client: InfrahubClient, group_ids: dict[str, str]) -> Non
         },
     }
 
+    # New users are saved together once every existence check is done
+    save_batch = await client.create_batch()
+
     # ========================================================================
     # Create Each User
     # ========================================================================
@@ -732,27 +951,13 @@ async def create_users(client: InfrahubClient, group_ids: dict[str, str]) -> Non
         group_id_list = [group_ids[group_name] for group_name in config["groups"]]
 
         # Check if user already exists in Infrahub
-        query = f"""
-        query {{
-          CoreAccount(name__value: "{username}") {{
-            edges {{
-              node {{
-                id
-              }}
-            }}
-          }}
-        }}
-        """
-
-        result = await client.execute_graphql(query=query)
-        edges = result.get("CoreAccount", {}).get("edges", [])
+        user_id = ids.get(("CoreAccount", username))
 
-        if edges:
+        if user_id:
             # User already exists - skip creation
-            user_id = edges[0]["node"]["id"]
             print(f"  User '{username}' already exists (ID: {user_id})")
         else:
-            # User doesn't exist - create it with group membership
+            # User doesn't exist - stage it with group membership
             user = await client.create(
                 kind="CoreAccount",
                 data={
@@ -763,8 +968,10 @@ async def create_users(client: InfrahubClient, group_ids: dict[str, str]) -> Non
                     "member_of_groups": group_id_list,  # Assign to groups
                 },
             )
-            await user.save()
-            print(f"  Created user '{username}' (ID: {user.id})")
+            save_batch.add(task=user.save, node=user)
+
+    async for user, _ in save_batch.execute():
+        print(f"  Created user '{user.name.value}' (ID: {user.id})")
 
 
 # ============================================================================
@@ -820,37 +1027,48 @@ async def main() -> int:
         ✓ Successfully created users, roles, and groups!
     """
     try:
-        # Connect to Infrahub using environment variables
-        # INFRAHUB_ADDRESS and INFRAHUB_API_TOKEN
-        client = InfrahubClient()
-
-        # ====================================================================
-        # Step 1: Ensure Permissions Exist
-        # ====================================================================
-        # Permissions are the foundation of the RBAC system
-        # They must be created first before roles can reference them
-        await ensure_permissions_exist(client)
-
-        # ====================================================================
-        # Step 2: Create Roles
-        # ====================================================================
-        # Roles are collections of permissions
-        # They reference permissions by UUID and return role UUIDs
-        role_ids = await create_roles(client)
-
-        # ====================================================================
-        # Step 3: Create Groups
-        # ====================================================================
-        # Groups assign roles to users
-        # They reference roles by UUID and return group UUIDs
-        group_ids = await create_groups(client, role_ids)
-
-        # ====================================================================
-        # Step 4: Create Users
-        # ====================================================================
-        # Users are assigned to groups to receive permissions
-        # They reference groups by UUID
-        await create_users(client, group_ids)
+        # Connection settings from environment variables (INFRAHUB_ADDRESS,
+        # INFRAHUB_API_TOKEN, and any TLS or proxy settings)
+        config = Config()
+
+        # One httpx pool for the whole run; closed when the block exits
+        async with pooled_http_client(config) as http_client:
+            config.requester = pooled_requester(http_client)
+            client = InfrahubClient(config=config)
+
+            # Existing IDs for every managed kind, loaded in a single query
+            ids = await prefetch_all(client)
+
+            # Identifier -> lookup future for permissions missing from ids
+            permission_lookups: dict[str, asyncio.Future[str | None]] = {}
+
+            # ================================================================
+            # Step 1: Ensure Permissions Exist
+            # ================================================================
+            # Permissions are the foundation of the RBAC system
+            # They must be created first before roles can reference them
+            await ensure_permissions_exist(client, ids)
+
+            # ================================================================
+            # Step 2: Create Roles
+            # ================================================================
+            # Roles are collections of permissions
+            # They reference permissions by UUID and return role UUIDs
+            role_ids = await create_roles(client, ids, permission_lookups)
+
+            # ================================================================
+            # Step 3: Create Groups
+            # ================================================================
+            # Groups assign roles to users
+            # They reference roles by UUID and return group UUIDs
+            group_ids = await create_groups(client, ids, role_ids)
+
+            # ================================================================
+            # Step 4: Create Users
+            # ================================================================
+            # Users are assigned to groups to receive permissions
+            # They reference groups by UUID
+            await create_users(client, ids, group_ids)
 
         # Success! All RBAC components created
         print("\n✓ Successfully created users, roles, and groups!")
@@ -16,6 +16,7 @@ import sys
 from pathlib import Path
 
 from infrahub_sdk import InfrahubClient
+from infrahub_sdk.node import InfrahubNode
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -24,21 +25,22 @@ from rich import box
 console = Console()
 
 
-async def get_containerlab_topologies(client: InfrahubClient) -> list[str]:
+async def get_topologies(client: InfrahubClient) -> list[InfrahubNode]:
+    """Fetch all topology deployments with their artifacts and devices in one query."""
+    return await client.all(kind="TopologyDataCenter", include=["artifacts", "devices"])
+
+
+async def get_containerlab_topologies(topologies: list[InfrahubNode]) -> list[str]:
     """Fetch containerlab topology artifacts and save to files."""
     directory_path = Path("./generated-configs/clab")
     directory_path.mkdir(parents=True, exist_ok=True)
 
     console.print("\n[cyan]→[/cyan] Fetching containerlab topologies...")
 
-    topologies = await client.all(kind="TopologyDataCenter")
-
     saved_topologies = []
     for topology in topologies:
         try:
             # Check if topology has containerlab-topology artifact
-            await topology.artifacts.fetch()
-
             has_clab_artifact = False
             for artifact in topology.artifacts.peers:
                 if artifact.display_label == "containerlab-topology":
@@ -68,20 +70,18 @@ async def get_containerlab_topologies(client: InfrahubClient) -> list[str]:
     return saved_topologies
 
 
-async def get_device_configs(client: InfrahubClient) -> int:
+async def get_device_configs(
+    client: InfrahubClient, topologies: list[InfrahubNode]
+) -> int:
     """Fetch device configuration artifacts and save to files (only devices in TopologyDataCenter)."""
     base_path = Path("./generated-configs/devices")
     base_path.mkdir(parents=True, exist_ok=True)
 
     console.print("\n[cyan]→[/cyan] Fetching device configurations (topology devices only)...")
 
-    # First, get all topology deployments to find which devices belong to them
-    topologies = await client.all(kind="TopologyDataCenter")
-
     # Build a set of device IDs that belong to topologies
     topology_device_ids = set()
     for topology in topologies:
-        await topology.devices.fetch()
         for device_edge in topology.devices.peers:
             topology_device_ids.add(device_edge.id)
 
@@ -101,14 +101,13 @@ async def get_device_configs(client: InfrahubClient) -> int:
     allowed_roles = ["leaf", "spine", "border_leaf"]
 
     config_count = 0
-    devices = await client.all(kind="DcimDevice")
+    # Only query topology devices, with their artifact list in the same request
+    devices = await client.filters(
+        kind="DcimDevice", ids=list(topology_device_ids), include=["artifacts"]
+    )
 
     for device in devices:
         try:
-            # Skip devices that are not part of a topology deployment
-            if device.id not in topology_device_ids:
-                continue
-
             # Get role value to filter devices
             # role is an attribute, not a relationship, so no need to fetch
             device_role = device.role.value if hasattr(device.role, 'value') else str(device.role) if device.role else None
@@ -117,9 +116,6 @@ async def get_device_configs(client: InfrahubClient) -> int:
             if device_role not in allowed_roles:
                 continue
 
-            # Fetch artifacts list
-            await device.artifacts.fetch()
-
             for artifact in device.artifacts.peers:
                 artifact_label = str(artifact.display_label)
 
@@ -155,21 +151,17 @@ async def get_device_configs(client: InfrahubClient) -> int:
     return config_count
 
 
-async def get_topology_cabling(client: InfrahubClient) -> int:
+async def get_topology_cabling(topologies: list[InfrahubNode]) -> int:
     """Fetch topology cabling matrix artifacts and save to files."""
     directory_path = Path("./generated-configs/cabling")
     directory_path.mkdir(parents=True, exist_ok=True)
 
     console.print("\n[cyan]→[/cyan] Fetching topology cabling matrices...")
 
-    topologies = await client.all(kind="TopologyDataCenter")
-
     cabling_count = 0
     for topology in topologies:
         try:
             # Check if topology has cabling artifact
-            await topology.artifacts.fetch()
-
             has_cabling_artifact = False
             for artifact in topology.artifacts.peers:
                 if artifact.display_label == "topology-cabling":
@@ -217,10 +209,13 @@ async def main(branch: str | None = None) -> int:
     else:
         client = InfrahubClient()
 
+    # Topologies (and their artifact and device lists) are shared by every step
+    topologies = await get_topologies(client)
+
     # Fetch all artifact types and track results
-    saved_topologies = await get_containerlab_topologies(client)
-    config_count = await get_device_configs(client)
-    cabling_count = await get_topology_cabling(client)
+    saved_topologies = await get_containerlab_topologies(topologies)
+    config_count = await get_device_configs(client, topologies)
+    cabling_count = await get_topology_cabling(topologies)
 
     # Check if any artifacts were retrieved
     topology_count = len(saved_topologies)
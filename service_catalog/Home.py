@@ -4,6 +4,11 @@ This is the main landing page for the Infrahub Service Catalog application.
 It displays lists of Data Centers and Colocation Centers with branch selection capability.
 """
 
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import pandas as pd
 import streamlit as st
 
 from utils import (
@@ -16,8 +21,42 @@ from utils import (
     display_logo,
     format_colocation_table,
     format_datacenter_table,
+    get_client,
+)
+from utils.api import (
+    InfrahubAPIError,
+    InfrahubConnectionError,
+    InfrahubGraphQLError,
+    InfrahubHTTPError,
 )
-from utils.api import InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError
+
+T = TypeVar("T")
+
+# Proposed changes and device count shown in the debug panel when a branch
+# has no data centers, fetched in a single round trip
+DEBUG_QUERY = """
+query {
+  CoreProposedChange {
+    edges {
+      node {
+        id
+        name { value }
+        state { value }
+      }
+    }
+  }
+  DcimDevice {
+    count
+    edges {
+      node {
+        id
+        name { value }
+        __typename
+      }
+    }
+  }
+}
+"""
 
 
 # Configure page layout and title
@@ -37,222 +76,463 @@ if "infrahub_url" not in st.session_state:
     st.session_state.infrahub_url = INFRAHUB_ADDRESS
 
 
-def main() -> None:
-    """Main function to render the landing page."""
+@st.cache_data(ttl=60, show_spinner=False)
+def load_branches(url: str, api_token: Optional[str]) -> List[Dict[str, Any]]:
+    """Fetch branches, cached process-wide for a short TTL.
 
-    # Display logo in sidebar
-    display_logo()
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
 
-    # Initialize API client
-    client = InfrahubClient(
-        st.session_state.infrahub_url,
-        api_token=INFRAHUB_API_TOKEN or None,
-        ui_url=INFRAHUB_UI_URL
-    )
+    Returns:
+        List of branch dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_branches()
 
-    # Page title
-    st.title("Infrahub Service Catalog")
-    st.markdown(
-        "Welcome to the Infrahub Service Catalog. View and manage your infrastructure resources."
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_branch_index(url: str, api_token: Optional[str]) -> Dict[str, int]:
+    """Map branch names to their position in the branch list, cached with it.
+
+    Lets the selector find the current branch with a dict lookup instead of
+    scanning the list on every rerun. Keys keep the branch list order.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+
+    Returns:
+        Dictionary of branch name to index
+    """
+    branches = load_branches(url, api_token)
+    return {branch["name"]: index for index, branch in enumerate(branches)}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_objects(
+    url: str, api_token: Optional[str], object_type: str, branch: str
+) -> List[Dict[str, Any]]:
+    """Fetch objects of a given kind on a branch, cached process-wide for a short TTL.
+
+    Switching back and forth between branches is served from the cache.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        object_type: Kind to fetch (e.g., "TopologyDataCenter")
+        branch: Branch name to query
+
+    Returns:
+        List of object dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_objects(object_type, branch)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_datacenter_table(
+    url: str, api_token: Optional[str], branch: str, ui_url: str
+) -> pd.DataFrame:
+    """Build the data center table for a branch, cached alongside its data.
+
+    Reruns that only change unrelated UI state reuse the finished DataFrame
+    instead of re-formatting it.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        branch: Branch name to query
+        ui_url: Infrahub UI URL used for the table links
+
+    Returns:
+        Formatted data center DataFrame
+    """
+    datacenters = load_objects(url, api_token, "TopologyDataCenter", branch)
+    return format_datacenter_table(datacenters, base_url=ui_url, branch=branch)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_colocation_table(
+    url: str, api_token: Optional[str], branch: str
+) -> pd.DataFrame:
+    """Build the colocation center table for a branch, cached alongside its data.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        branch: Branch name to query
+
+    Returns:
+        Formatted colocation center DataFrame
+    """
+    colocations = load_objects(url, api_token, "TopologyColocationCenter", branch)
+    return format_colocation_table(colocations)
+
+
+async def gather_in_threads(*calls: Callable[[], Any]) -> List[Any]:
+    """Run blocking calls concurrently in worker threads.
+
+    The client is synchronous, so each call gets its own thread and the
+    round trips share one wait. Failures are returned in place of the result
+    so each page section can report its own error.
+
+    Args:
+        *calls: Zero-argument callables; bind arguments with functools.partial
+            so nothing reads st.session_state from a worker thread
+
+    Returns:
+        Results in call order, where any entry may be the raised exception
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(call) for call in calls), return_exceptions=True
     )
 
-    # Branch selector in sidebar
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Branch Selection")
 
+async def load_datacenter_section(
+    url: str, api_token: Optional[str], branch: str, ui_url: str
+) -> Tuple[pd.DataFrame, Any]:
+    """Load the data center table and, off main, its debug query alongside it.
+
+    The debug panel is only shown for an empty non-main branch, but its
+    query starts together with the table so it costs no extra wall-clock
+    time when it is needed.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        branch: Branch name to query
+        ui_url: Infrahub UI URL used for the table links
+
+    Returns:
+        Tuple of (data center DataFrame, debug query result); the debug
+        result is None on main and may be the exception raised loading it
+
+    Raises:
+        InfrahubAPIError: If the data center table cannot be loaded
+    """
+    loads: List[Callable[[], Any]] = [
+        partial(load_datacenter_table, url, api_token, branch, ui_url)
+    ]
+    if branch != "main":
+        client = get_client(url, api_token, ui_url)
+        loads.append(partial(client.execute_graphql, DEBUG_QUERY, branch=branch))
+
+    dc_result, *debug_results = await gather_in_threads(*loads)
+    return unwrap(dc_result), debug_results[0] if debug_results else None
+
+
+def unwrap(result: Union[T, BaseException]) -> T:
+    """Return a gathered result, re-raising it if it is an exception.
+
+    Args:
+        result: Entry from asyncio.gather(..., return_exceptions=True)
+
+    Returns:
+        The result itself when it is not an exception
+
+    Raises:
+        InfrahubAPIError: The gathered API error, which every renderer
+            reports as a section error
+        BaseException: Any other gathered exception, which propagates
+    """
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+async def render_sections(
+    sections: List[Tuple[Callable[[], Any], Callable[[Any], Awaitable[None]]]],
+) -> None:
+    """Load every section concurrently and render each one as soon as it is ready.
+
+    Loaders run in worker threads; renderers run on the script thread as
+    their own loader finishes, so a fast section never waits on a slow one.
+
+    Args:
+        sections: (loader, renderer) pairs. Loaders are blocking callables
+            or coroutine functions; the renderer receives the loaded value,
+            or the InfrahubAPIError raised while loading it, and must report
+            that error (including the base class) itself. Any other error
+            propagates.
+    """
+
+    async def run_section(
+        load: Callable[[], Any], render: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        try:
+            if asyncio.iscoroutinefunction(load):
+                result = await load()
+            else:
+                result = await asyncio.to_thread(load)
+        except InfrahubAPIError as e:
+            result = e
+        await render(result)
+
+    await asyncio.gather(*(run_section(load, render) for load, render in sections))
+
+
+async def render_branch_selector(
+    selector_slot: Any, error_slot: Any, branch: str, branch_index_result: Any
+) -> None:
+    """Render the sidebar branch selector once the branch list has loaded.
+
+    Args:
+        selector_slot: Sidebar container for the selector
+        error_slot: Main-area container for connection errors
+        branch: Currently selected branch
+        branch_index_result: Branch name to index map, or the
+            InfrahubAPIError raised loading it
+    """
     try:
-        # Fetch branches (cache in session state to avoid repeated API calls)
-        if "branches" not in st.session_state:
-            with st.spinner("Loading branches..."):
-                st.session_state.branches = client.get_branches()
-
-        branches = st.session_state.branches
-
-        if branches:
-            # Extract branch names
-            branch_names = [branch["name"] for branch in branches]
-
-            # Find index of currently selected branch
-            try:
-                default_index = branch_names.index(st.session_state.selected_branch)
-            except ValueError:
-                default_index = 0
-                st.session_state.selected_branch = (
-                    branch_names[0] if branch_names else DEFAULT_BRANCH
+        branch_index = unwrap(branch_index_result)
+
+        with selector_slot:
+            if branch_index:
+                # Extract branch names
+                branch_names = list(branch_index)
+
+                # Find index of currently selected branch
+                default_index = branch_index.get(branch)
+                if default_index is None:
+                    # The tables were loaded for a branch that no longer exists;
+                    # fall back to the first branch and load again
+                    st.session_state.selected_branch = branch_names[0]
+                    st.rerun()
+
+                # Display branch selector dropdown
+                selected_branch = st.selectbox(
+                    "Select Branch",
+                    options=branch_names,
+                    index=default_index,
+                    help="Choose a branch to view its infrastructure resources",
+                    key="branch_selector",
                 )
 
-            # Display branch selector dropdown
-            selected_branch = st.sidebar.selectbox(
-                "Select Branch",
-                options=branch_names,
-                index=default_index,
-                help="Choose a branch to view its infrastructure resources",
-                key="branch_selector",
-            )
+                # Update session state if branch changed
+                if selected_branch != branch:
+                    st.session_state.selected_branch = selected_branch
+                    st.rerun()
+            else:
+                st.warning("No branches found")
 
-            # Update session state if branch changed
-            if selected_branch != st.session_state.selected_branch:
-                st.session_state.selected_branch = selected_branch
-                st.rerun()
-        else:
-            st.sidebar.warning("No branches found")
+            # Display current branch info
+            st.info(f"Current Branch: **{branch}**")
 
     except InfrahubConnectionError as e:
-        display_error("Unable to connect to Infrahub", str(e))
+        with error_slot:
+            display_error("Unable to connect to Infrahub", str(e))
         st.stop()
     except InfrahubHTTPError as e:
-        display_error(
-            f"HTTP Error {e.status_code}", f"{str(e)}\n\nResponse: {e.response_text}"
-        )
+        with error_slot:
+            display_error(
+                f"HTTP Error {e.status_code}", f"{str(e)}\n\nResponse: {e.response_text}"
+            )
         st.stop()
     except InfrahubGraphQLError as e:
-        display_error("GraphQL Error", str(e))
+        with error_slot:
+            display_error("GraphQL Error", str(e))
         st.stop()
-    except Exception as e:
-        display_error("Unexpected error while fetching branches", str(e))
+    except InfrahubAPIError as e:
+        with error_slot:
+            display_error("Failed to fetch branches", str(e))
         st.stop()
 
-    # Display current branch info
-    st.sidebar.info(f"Current Branch: **{st.session_state.selected_branch}**")
+
+async def render_datacenters(
+    slot: Any, client: InfrahubClient, branch: str, dc_result: Any
+) -> None:
+    """Render the data center section once its table has loaded.
+
+    Args:
+        slot: Placeholder reserved for the section body
+        client: API client whose address is shown in the debug panel
+        branch: Branch the table was loaded from
+        dc_result: Result of load_datacenter_section(), or the
+            InfrahubAPIError raised loading it
+    """
+    with slot.container():
+        try:
+            dc_df, debug_result = unwrap(dc_result)
+
+            if not dc_df.empty:
+                # Display datacenter table
+                st.dataframe(
+                    dc_df,
+                    width="stretch",
+                    hide_index=True,
+                    column_config={
+                        "Link": st.column_config.LinkColumn(
+                            "View in Infrahub",
+                            help="Open this datacenter in the Infrahub UI",
+                            display_text="Open"
+                        )
+                    }
+                )
+                st.caption(f"Found {len(dc_df)} data center(s)")
+            else:
+                st.info("No data centers found in this branch.")
+
+                # Show debug info if on a non-main branch
+                if debug_result is not None:
+                    with st.expander("🔍 Debug Information"):
+                        st.markdown("**Query Details:**")
+                        st.code(f"Branch: {branch}")
+                        st.code("Object Type: TopologyDataCenter")
+                        st.code(f"Infrahub Address: {client.base_url}")
+
+                        # Check for proposed changes (fetched alongside the table
+                        # by load_datacenter_section())
+                        try:
+                            result = unwrap(debug_result)
+                            pcs = [
+                                edge.get("node", {})
+                                for edge in result.get("CoreProposedChange", {}).get("edges", [])
+                            ]
+                            if pcs:
+                                st.markdown("**Proposed Changes on this branch:**")
+                                for pc in pcs:
+                                    pc_name = pc.get("name", {}).get("value", "Unknown")
+                                    pc_state = pc.get("state", {}).get("value", "Unknown")
+                                    st.write(f"- {pc_name} (State: {pc_state})")
+                            else:
+                                st.write("No proposed changes found on this branch.")
+                        except InfrahubAPIError as e:
+                            st.write(f"Could not fetch proposed changes: {e}")
+
+                        # Check what other objects exist on this branch
+                        st.markdown("**Other objects on this branch:**")
+                        try:
+                            result = unwrap(debug_result)
+                            device_count = result.get("DcimDevice", {}).get("count", 0)
+                            st.write(f"- DcimDevice: {device_count} object(s)")
+
+                            if device_count > 0:
+                                devices = result.get("DcimDevice", {}).get("edges", [])
+                                for device in devices[:5]:  # Show first 5
+                                    dev_name = device.get("node", {}).get("name", {}).get("value", "Unknown")
+                                    st.write(f"  - {dev_name}")
+                        except InfrahubAPIError as e:
+                            st.write(f"Error checking other objects: {e}")
+
+        except InfrahubConnectionError as e:
+            display_error("Unable to connect to Infrahub", str(e))
+        except InfrahubHTTPError as e:
+            display_error(
+                f"HTTP Error {e.status_code} while fetching data centers",
+                f"{str(e)}\n\nResponse: {e.response_text}",
+            )
+        except InfrahubGraphQLError as e:
+            display_error("GraphQL Error while fetching data centers", str(e))
+        except InfrahubAPIError as e:
+            display_error("Failed to fetch data centers", str(e))
+
+
+async def render_colocations(slot: Any, colo_result: Any) -> None:
+    """Render the colocation center section once its table has loaded.
+
+    Args:
+        slot: Placeholder reserved for the section body
+        colo_result: Colocation DataFrame, or the InfrahubAPIError raised
+            loading it
+    """
+    with slot.container():
+        try:
+            colo_df = unwrap(colo_result)
+
+            if not colo_df.empty:
+                # Display colocation table
+                st.dataframe(colo_df, width="stretch", hide_index=True)
+                st.caption(f"Found {len(colo_df)} colocation center(s)")
+            else:
+                st.info("No colocation centers found in this branch.")
+
+        except InfrahubConnectionError as e:
+            display_error("Unable to connect to Infrahub", str(e))
+        except InfrahubHTTPError as e:
+            display_error(
+                f"HTTP Error {e.status_code} while fetching colocation centers",
+                f"{str(e)}\n\nResponse: {e.response_text}",
+            )
+        except InfrahubGraphQLError as e:
+            display_error("GraphQL Error while fetching colocation centers", str(e))
+        except InfrahubAPIError as e:
+            display_error("Failed to fetch colocation centers", str(e))
+
+
+def main() -> None:
+    """Main function to render the landing page."""
+
+    # Display logo in sidebar
+    display_logo()
+
+    # Read connection settings and the selected branch once per rerun
+    url = st.session_state.infrahub_url
+    api_token = INFRAHUB_API_TOKEN or None
+    branch = st.session_state.selected_branch
+
+    # Shared API client (built once per process, reused across reruns)
+    client = get_client(url, api_token, INFRAHUB_UI_URL)
+
+    # Page title
+    st.title("Infrahub Service Catalog")
+    st.markdown(
+        "Welcome to the Infrahub Service Catalog. View and manage your infrastructure resources."
+    )
+
+    # Page skeleton: each section reserves its slot now and fills it in as
+    # soon as its own data arrives, whichever finishes first
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("Branch Selection")
+    branch_slot = st.sidebar.container()
+    branch_error_slot = st.container()
 
     # Main content area
     st.markdown("---")
 
     # Data Centers section
     st.header("Data Centers")
-
-    try:
-        with st.spinner(
-            f"Loading data centers from branch '{st.session_state.selected_branch}'..."
-        ):
-            datacenters = client.get_objects(
-                "TopologyDataCenter", st.session_state.selected_branch
-            )
-
-        if datacenters:
-            # Format and display datacenter table
-            dc_df = format_datacenter_table(
-                datacenters,
-                base_url=INFRAHUB_UI_URL,
-                branch=st.session_state.selected_branch
-            )
-            st.dataframe(
-                dc_df,
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "Link": st.column_config.LinkColumn(
-                        "View in Infrahub",
-                        help="Open this datacenter in the Infrahub UI",
-                        display_text="Open"
-                    )
-                }
-            )
-            st.caption(f"Found {len(datacenters)} data center(s)")
-        else:
-            st.info("No data centers found in this branch.")
-
-            # Show debug info if on a non-main branch
-            if st.session_state.selected_branch != "main":
-                with st.expander("🔍 Debug Information"):
-                    st.markdown("**Query Details:**")
-                    st.code(f"Branch: {st.session_state.selected_branch}")
-                    st.code("Object Type: TopologyDataCenter")
-                    st.code(f"Infrahub Address: {client.base_url}")
-
-                    # Check for proposed changes
-                    try:
-                        pcs = client.get_proposed_changes(st.session_state.selected_branch)
-                        if pcs:
-                            st.markdown("**Proposed Changes on this branch:**")
-                            for pc in pcs:
-                                pc_name = pc.get("name", {}).get("value", "Unknown")
-                                pc_state = pc.get("state", {}).get("value", "Unknown")
-                                st.write(f"- {pc_name} (State: {pc_state})")
-                        else:
-                            st.write("No proposed changes found on this branch.")
-                    except Exception as e:
-                        st.write(f"Could not fetch proposed changes: {e}")
-
-                    # Check what other objects exist on this branch
-                    st.markdown("**Other objects on this branch:**")
-                    try:
-                        # Query for generic devices
-                        device_query = """
-                        query {
-                          DcimDevice {
-                            count
-                            edges {
-                              node {
-                                id
-                                name { value }
-                                __typename
-                              }
-                            }
-                          }
-                        }
-                        """
-                        result = client.execute_graphql(device_query, branch=st.session_state.selected_branch)
-                        device_count = result.get("DcimDevice", {}).get("count", 0)
-                        st.write(f"- DcimDevice: {device_count} object(s)")
-
-                        if device_count > 0:
-                            devices = result.get("DcimDevice", {}).get("edges", [])
-                            for device in devices[:5]:  # Show first 5
-                                dev_name = device.get("node", {}).get("name", {}).get("value", "Unknown")
-                                st.write(f"  - {dev_name}")
-                    except Exception as e:
-                        st.write(f"Error checking other objects: {e}")
-
-    except InfrahubConnectionError as e:
-        display_error("Unable to connect to Infrahub", str(e))
-    except InfrahubHTTPError as e:
-        display_error(
-            f"HTTP Error {e.status_code} while fetching data centers",
-            f"{str(e)}\n\nResponse: {e.response_text}",
-        )
-    except InfrahubGraphQLError as e:
-        display_error("GraphQL Error while fetching data centers", str(e))
-    except Exception as e:
-        display_error("Unexpected error while fetching data centers", str(e))
+    dc_slot = st.empty()
+    dc_slot.caption(
+        f"Loading data centers from branch '{branch}'..."
+    )
 
     # Colocation Centers section
     st.markdown("---")
     st.header("Colocation Centers")
-
-    try:
-        with st.spinner(
-            f"Loading colocation centers from branch '{st.session_state.selected_branch}'..."
-        ):
-            colocations = client.get_objects(
-                "TopologyColocationCenter", st.session_state.selected_branch
-            )
-
-        if colocations:
-            # Format and display colocation table
-            colo_df = format_colocation_table(colocations)
-            st.dataframe(colo_df, width="stretch", hide_index=True)
-            st.caption(f"Found {len(colocations)} colocation center(s)")
-        else:
-            st.info("No colocation centers found in this branch.")
-
-    except InfrahubConnectionError as e:
-        display_error("Unable to connect to Infrahub", str(e))
-    except InfrahubHTTPError as e:
-        display_error(
-            f"HTTP Error {e.status_code} while fetching colocation centers",
-            f"{str(e)}\n\nResponse: {e.response_text}",
-        )
-    except InfrahubGraphQLError as e:
-        display_error("GraphQL Error while fetching colocation centers", str(e))
-    except Exception as e:
-        display_error("Unexpected error while fetching colocation centers", str(e))
+    colo_slot = st.empty()
+    colo_slot.caption(
+        f"Loading colocation centers from branch '{branch}'..."
+    )
 
     # Footer
     st.markdown("---")
     st.markdown(
-        f"Connected to Infrahub at `{st.session_state.infrahub_url}` | "
-        f"Branch: `{st.session_state.selected_branch}`"
+        f"Connected to Infrahub at `{url}` | "
+        f"Branch: `{branch}`"
+    )
+
+    # Fetch branches and both topology tables concurrently (each cached
+    # across sessions and reruns) and render them in arrival order
+    asyncio.run(
+        render_sections(
+            [
+                (
+                    partial(load_branch_index, url, api_token),
+                    partial(
+                        render_branch_selector, branch_slot, branch_error_slot, branch
+                    ),
+                ),
+                (
+                    partial(
+                        load_datacenter_section, url, api_token, branch, INFRAHUB_UI_URL
+                    ),
+                    partial(render_datacenters, dc_slot, client, branch),
+                ),
+                (
+                    partial(load_colocation_table, url, api_token, branch),
+                    partial(render_colocations, colo_slot),
+                ),
+            ]
+        )
     )
 
 
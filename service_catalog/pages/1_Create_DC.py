@@ -3,8 +3,10 @@
 This page provides a form-based interface for creating new Data Centers in Infrahub.
 """
 
+import time
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import streamlit as st
 import yaml
@@ -19,6 +21,7 @@ from utils import (
     display_error,
     display_logo,
     display_success,
+    get_client,
 )
 from utils.api import (
     InfrahubAPIError,
@@ -28,6 +31,34 @@ from utils.api import (
 )
 
 
+# Use libyaml's C parser when PyYAML was built with it; same safe subset, much faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Seconds before the active prefix list is fetched again on a rerun
+PREFIX_REFRESH_INTERVAL = 30
+
+# Seconds between progress repaints while waiting for the generator
+PROGRESS_REPAINT_INTERVAL = 5
+
+
+# Routing strategies offered by the form
+STRATEGY_OPTIONS = ("ospf-ibgp", "isis-ibgp", "ospf-ebgp")
+
+# Groups a new data center joins unless its template says otherwise
+DEFAULT_GROUPS = ("topologies_dc", "topologies_clab")
+
+
+# Steps of the DC creation workflow, in order (state["step"] is 1-based)
+WORKFLOW_STEPS = (
+    "Creating branch",
+    "Creating datacenter",
+    "Waiting for generator",
+    "Creating proposed change",
+    "Complete",
+)
+
+
 # Configure page layout and title
 st.set_page_config(
     page_title="Create Data Center - Infrahub Service Catalog",
@@ -36,24 +67,37 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Initialize session state
-if "selected_branch" not in st.session_state:
-    st.session_state.selected_branch = DEFAULT_BRANCH
+# Initialize session state (evaluated per run, so the mutable defaults are fresh)
+SESSION_DEFAULTS = {
+    "selected_branch": DEFAULT_BRANCH,
+    "infrahub_url": INFRAHUB_ADDRESS,
+    "selected_dc_template": "None (Manual Entry)",
+    "available_dc_templates": [],
+}
+for key, value in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, value)
 
-if "infrahub_url" not in st.session_state:
-    st.session_state.infrahub_url = INFRAHUB_ADDRESS
 
-if "form_data" not in st.session_state:
-    st.session_state.form_data = {}
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def parse_template_file(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a template YAML file, cached process-wide.
 
-if "dc_template" not in st.session_state:
-    st.session_state.dc_template = None
+    The modification time is part of the cache key, so editing the file on
+    the mounted volume invalidates the cached copy. Errors are not cached.
 
-if "selected_dc_template" not in st.session_state:
-    st.session_state.selected_dc_template = "None (Manual Entry)"
+    Args:
+        path: Path of the YAML file
+        mtime: Modification time of the file (cache key only)
 
-if "available_dc_templates" not in st.session_state:
-    st.session_state.available_dc_templates = []
+    Returns:
+        Parsed template data
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
 def load_dc_template() -> Optional[Dict[str, Any]]:
@@ -68,9 +112,7 @@ def load_dc_template() -> Optional[Dict[str, Any]]:
     template_path = Path("/objects/dc/dc-arista-s.yml")
 
     try:
-        with open(template_path, "r") as f:
-            template_data = yaml.safe_load(f)
-        return template_data
+        return parse_template_file(str(template_path), template_path.stat().st_mtime)
     except FileNotFoundError:
         st.error(f"Template file not found at {template_path}")
         return None
@@ -117,9 +159,7 @@ def load_specific_dc_template(template_name: str) -> Optional[Dict[str, Any]]:
     template_path = Path(f"/objects/dc/{template_name}.yml")
 
     try:
-        with open(template_path, "r") as f:
-            template_data = yaml.safe_load(f)
-        return template_data
+        return parse_template_file(str(template_path), template_path.stat().st_mtime)
     except FileNotFoundError:
         st.error(f"Template file not found at {template_path}")
         return None
@@ -162,7 +202,7 @@ def extract_template_values(template: Dict[str, Any]) -> Optional[Dict[str, Any]
             "management_subnet_data": data.get("management_subnet", {}).get("data", {}),
             "customer_subnet_data": data.get("customer_subnet", {}).get("data", {}),
             "technical_subnet_data": data.get("technical_subnet", {}).get("data", {}),
-            "member_of_groups": data.get("member_of_groups", ["topologies_dc", "topologies_clab"]),
+            "member_of_groups": data.get("member_of_groups", list(DEFAULT_GROUPS)),
         }
 
         return values
@@ -171,88 +211,147 @@ def extract_template_values(template: Dict[str, Any]) -> Optional[Dict[str, Any]
         return None
 
 
-def extract_field_options(template: Dict[str, Any], field_name: str) -> List[str]:
-    """Extract dropdown options from the template for a specific field.
+def wait_for_generator(
+    duration: int = 60, check_fn: Optional[Callable[[], bool]] = None
+) -> bool:
+    """Wait for the Infrahub generator to complete with a progress indicator.
+
+    Displays a single progress line that is repainted every
+    PROGRESS_REPAINT_INTERVAL seconds. Between repaints and status checks the
+    loop sleeps until the next one is due instead of ticking every second.
+    When ``check_fn`` is given it is polled with exponential backoff (1s,
+    growing to at most 5s) and the wait ends as soon as it reports that the
+    generator has finished; ``duration`` is then only an upper bound. If the
+    check itself fails, the wait falls back to the full duration.
 
     Args:
-        template: Parsed template dictionary
-        field_name: Name of the field to extract options for
+        duration: Maximum wait duration in seconds (default: 60)
+        check_fn: Optional callable returning True once the generator is done
 
     Returns:
-        List of valid options for the field, or empty list if not found.
+        True if ``check_fn`` confirmed completion, False if the full duration elapsed
     """
-    try:
-        # Navigate to the data section
-        spec = template.get("spec", {})
-        data_list = spec.get("data", [])
-
-        if not data_list:
-            return []
-
-        # Get the first data item as a reference
-        first_item = data_list[0]
-
-        # Extract the field value
-        field_value = first_item.get(field_name)
+    progress_display = st.empty()
+    progress_display.markdown("**Generator running...** starting wait")
+
+    start = time.monotonic()
+    next_paint = 0.0
+    next_check = 0.0
+    interval = 1.0
+    completed = False
+
+    while True:
+        elapsed = time.monotonic() - start
+        if elapsed >= duration:
+            break
+
+        # Poll the generator status on a backoff schedule
+        if check_fn is not None and elapsed >= next_check:
+            try:
+                completed = check_fn()
+            except InfrahubAPIError:
+                # Status unavailable - fall back to waiting the full duration
+                check_fn = None
+            if completed:
+                break
+            next_check = elapsed + interval
+            interval = min(interval * 1.5, 5.0)
+
+        # Repaint progress against the upper bound every PROGRESS_REPAINT_INTERVAL
+        if elapsed >= next_paint:
+            percentage = int(elapsed / duration * 100)
+            progress_display.markdown(
+                f"**Generator running...** {percentage}% — "
+                f"{int(elapsed)}s elapsed / {duration}s max"
+            )
+            next_paint = elapsed + PROGRESS_REPAINT_INTERVAL
 
-        if field_value is not None:
-            # For simple fields, return the value as a single option
-            # In a real scenario, you might want to query Infrahub for valid options
-            return [str(field_value)]
+        # Sleep until the next repaint, status check or the deadline
+        wake_at = min(next_paint, duration)
+        if check_fn is not None:
+            wake_at = min(wake_at, next_check)
+        time.sleep(max(wake_at - (time.monotonic() - start), 0))
 
-        return []
-    except Exception:
-        return []
+    # Clean up (the caller reports the outcome in the status container)
+    progress_display.empty()
 
+    return completed
 
-def wait_for_generator(duration: int = 60) -> None:
-    """Wait for the Infrahub generator to complete with a progress indicator.
 
-    Displays a progress bar that updates every second during the wait period.
-    This allows the generator event to complete before creating a Proposed Change.
+def generator_finished(client: InfrahubClient, object_id: str, branch: str) -> bool:
+    """Check whether every generator instance for an object has finished.
 
     Args:
-        duration: Wait duration in seconds (default: 60)
+        client: InfrahubClient instance
+        object_id: ID of the object the generators run against
+        branch: Branch the object was created in
+
+    Returns:
+        True once at least one generator instance exists and none is still
+        pending or processing
     """
-    import time
+    statuses = client.get_generator_statuses(object_id, branch)
+    return bool(statuses) and all(status in ("ready", "error") for status in statuses)
 
-    progress_bar = st.progress(0, text="Starting generator wait...")
-    time_display = st.empty()
 
-    for i in range(duration + 1):
-        # Calculate progress (0.0 to 1.0)
-        progress = i / duration
-        percentage = int(progress * 100)
+def expire_active_prefixes() -> None:
+    """Mark the cached active prefixes as stale so the next run refetches them."""
+    st.session_state.prefixes_fetched_at = None
 
-        # Update progress bar with text
-        progress_bar.progress(
-            progress,
-            text=f"Generator running... {percentage}% complete"
-        )
 
-        # Update status text
-        remaining = duration - i
-        elapsed = i
+def build_name_id_map(nodes: List[Dict[str, Any]], attribute: str = "name") -> Dict[str, str]:
+    """Map the display value of each node to its ID.
 
-        # Show time information with better formatting
-        time_display.markdown(
-            f"**Time:** {elapsed}s elapsed / {remaining}s remaining ({duration}s total)"
-        )
+    Args:
+        nodes: List of node dictionaries as returned by the API client
+        attribute: Attribute whose value is used as the display name
 
-        # Wait 1 second (except on last iteration)
-        if i < duration:
-            time.sleep(1)
+    Returns:
+        Dict[str, str]: Display value to node ID, in the order of the nodes.
+            Nodes without a value or an ID are skipped.
+    """
+    return {
+        value: node["id"]
+        for node in nodes
+        if (value := node.get(attribute, {}).get("value")) and node.get("id")
+    }
 
-    # Show completion
-    progress_bar.progress(1.0, text="✓ Generator wait complete!")
-    time_display.markdown("**✓ Generator processing time completed**")
 
-    # Brief pause to show completion
-    time.sleep(1)
+def prefix_selector(
+    label: str,
+    key: str,
+    subnet: str,
+    option_list: List[str],
+    prefix_options: Dict[str, str],
+    template_prefix: str,
+    disabled: bool,
+) -> Optional[str]:
+    """Render the prefix selectbox for one subnet type.
 
-    # Clean up
-    progress_bar.empty()
-    time_display.empty()
+    Args:
+        label: Selectbox label
+        key: Widget key
+        subnet: Subnet type shown in the help text (e.g. "management")
+        option_list: Prefix values to offer
+        prefix_options: Prefix value to prefix ID mapping
+        template_prefix: Prefix pre-selected by the template, if any
+        disabled: Whether the selectbox is read-only
+
+    Returns:
+        ID of the selected prefix, or None if there are no active prefixes
+    """
+    # Pre-select the prefix from the template if it is offered
+    index = option_list.index(template_prefix) if template_prefix and template_prefix in option_list else 0
+
+    prefix_display = st.selectbox(
+        label,
+        options=option_list,
+        index=index,
+        key=key,
+        help=f"Select an active prefix for {subnet} subnet",
+        disabled=disabled,
+    )
+    return prefix_options.get(prefix_display) if prefix_options else None
 
 
 def initialize_dc_creation_state(form_data: Dict[str, Any]) -> None:
@@ -268,6 +367,7 @@ def initialize_dc_creation_state(form_data: Dict[str, Any]) -> None:
         "form_data": form_data,
         "branch_created": False,
         "dc_created": False,
+        "dc_id": None,
         "pc_created": False,
         "error": None,
         "pc_url": None,
@@ -282,28 +382,24 @@ def render_progress_tracker() -> None:
     state = st.session_state.dc_creation
     current_step = state["step"]
 
-    steps = [
-        "Creating branch",
-        "Creating datacenter",
-        "Waiting for generator",
-        "Creating proposed change",
-        "Complete"
-    ]
-
-    progress_md = "### Progress\n\n"
-    for i, step_name in enumerate(steps, 1):
+    lines = ["### Progress"]
+    for i, step_name in enumerate(WORKFLOW_STEPS, 1):
         if i < current_step:
-            progress_md += f"✓ {step_name}\n\n"
+            lines.append(f"✓ {step_name}")
         elif i == current_step:
-            progress_md += f"⏳ **{step_name}**\n\n"
+            lines.append(f"⏳ **{step_name}**")
         else:
-            progress_md += f"⏸️ {step_name}\n\n"
+            lines.append(f"⏸️ {step_name}")
 
-    st.markdown(progress_md)
+    st.markdown("\n\n".join(lines))
 
 
 def execute_dc_creation_step(client: InfrahubClient) -> None:
-    """Execute the current step of DC creation workflow."""
+    """Execute the current step of DC creation workflow.
+
+    On success the step counter in session state is advanced; on failure the
+    workflow is marked inactive.
+    """
     state = st.session_state.dc_creation
     step = state["step"]
     branch_name = state["branch_name"]
@@ -313,14 +409,14 @@ def execute_dc_creation_step(client: InfrahubClient) -> None:
     try:
         if step == 1:
             # Step 1: Create branch
-            with st.status("Creating branch...", expanded=True) as status:
-                st.write(f"Creating branch: {branch_name}")
+            # The label names the object while the call runs; details are
+            # written once it returns
+            with st.status(f"Creating branch {branch_name}...", expanded=True) as status:
                 branch = client.create_branch(branch_name, from_branch="main")
-                st.write(f"✓ Branch created: {branch['name']}")
+                st.markdown(f"Creating branch: {branch_name}\n\n✓ Branch created: {branch['name']}")
                 status.update(label="Branch created!", state="complete")
                 state["branch_created"] = True
                 state["step"] = 2
-                st.rerun()
 
         elif step == 2:
             # Step 2: Create datacenter
@@ -335,43 +431,45 @@ def execute_dc_creation_step(client: InfrahubClient) -> None:
                 "management_subnet": form_data["management_subnet"],
                 "customer_subnet": form_data["customer_subnet"],
                 "technical_subnet": form_data["technical_subnet"],
-                "member_of_groups": form_data.get("member_of_groups", ["topologies_dc", "topologies_clab"]),
+                "member_of_groups": form_data.get("member_of_groups", list(DEFAULT_GROUPS)),
             }
 
-            with st.status("Creating datacenter...", expanded=True) as status:
-                st.write(f"Creating datacenter: {dc_name}")
+            with st.status(f"Creating datacenter {dc_name}...", expanded=True) as status:
                 dc = client.create_datacenter(branch_name, dc_data)
-                st.write(f"✓ Datacenter created: {dc['name']['value']}")
+                st.markdown(f"Creating datacenter: {dc_name}\n\n✓ Datacenter created: {dc['name']['value']}")
                 status.update(label="Datacenter created!", state="complete")
                 state["dc_created"] = True
+                state["dc_id"] = dc.get("id")
                 state["step"] = 3
-                st.rerun()
 
         elif step == 3:
             # Step 3: Wait for generator
-            with st.status("Waiting for generator...", expanded=True) as status:
-                st.write(f"Waiting {GENERATOR_WAIT_TIME} seconds for generator to complete...")
-                wait_for_generator(GENERATOR_WAIT_TIME)
-                st.write("✓ Generator wait complete")
+            # Collapsed: the label and spinner carry the state during the long wait
+            with st.status("Waiting for generator...", expanded=False) as status:
+                st.write(f"Waiting up to {GENERATOR_WAIT_TIME} seconds for generator to complete...")
+                check_fn = None
+                if state.get("dc_id"):
+                    check_fn = partial(generator_finished, client, state["dc_id"], branch_name)
+                if wait_for_generator(GENERATOR_WAIT_TIME, check_fn):
+                    st.write("✓ Generator finished")
+                else:
+                    st.write("✓ Generator wait complete")
                 status.update(label="Generator complete!", state="complete")
                 state["step"] = 4
-                st.rerun()
 
         elif step == 4:
             # Step 4: Create proposed change
-            with st.status("Creating Proposed Change...", expanded=True) as status:
-                pc_name = f"Add Data Center: {dc_name}"
-                pc_description = f"Proposed change to add new data center {dc_name} in {form_data.get('location_name', form_data['location'])}"
-                st.write(f"Creating Proposed Change: {pc_name}")
+            pc_name = f"Add Data Center: {dc_name}"
+            pc_description = f"Proposed change to add new data center {dc_name} in {form_data.get('location_name', form_data['location'])}"
+            with st.status(f"Creating Proposed Change {pc_name}...", expanded=True) as status:
                 pc = client.create_proposed_change(branch_name, pc_name, pc_description)
                 pc_id = pc["id"]
                 pc_url = client.get_proposed_change_url(pc_id)
-                st.write("✓ Proposed Change created")
+                st.markdown(f"Creating Proposed Change: {pc_name}\n\n✓ Proposed Change created")
                 status.update(label="Proposed Change created!", state="complete")
                 state["pc_created"] = True
                 state["pc_url"] = pc_url
                 state["step"] = 5
-                st.rerun()
 
         elif step == 5:
             # Step 5: Complete - show success message
@@ -390,6 +488,10 @@ def execute_dc_creation_step(client: InfrahubClient) -> None:
             Click the link above to review and merge your changes in Infrahub.
             """)
 
+            # Nothing reads the finished workflow again; don't keep it (and its
+            # form data) in the session until the next submission
+            del st.session_state.dc_creation
+
     except (InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError, InfrahubAPIError) as e:
         state["error"] = str(e)
         state["active"] = False
@@ -414,6 +516,25 @@ def execute_dc_creation_step(client: InfrahubClient) -> None:
             )
 
 
+def run_dc_creation_workflow(client: InfrahubClient, tracker: Any) -> None:
+    """Run the remaining DC creation steps within the current script run.
+
+    Steps follow each other directly instead of through a rerun per step.
+    The step counter lives in session state, so a page reload mid-flight
+    resumes from the step that was in progress.
+
+    Args:
+        client: InfrahubClient instance
+        tracker: st.empty() placeholder the progress tracker is redrawn into
+    """
+    state = st.session_state.dc_creation
+
+    while state["active"]:
+        with tracker.container():
+            render_progress_tracker()
+        execute_dc_creation_step(client)
+
+
 def handle_dc_creation(client: InfrahubClient, form_data: Dict[str, Any]) -> None:
     """Initialize the DC creation workflow.
 
@@ -443,73 +564,69 @@ def main() -> None:
     else:
         st.info("📋 Datacenter creation in progress... Form is read-only during execution.")
 
-    # Initialize API client to fetch locations
-    client = InfrahubClient(
-        st.session_state.infrahub_url,
-        api_token=INFRAHUB_API_TOKEN or None,
-        ui_url=INFRAHUB_UI_URL
-    )
+    # Shared API client, so its connection pool survives reruns and submissions
+    client = get_client(st.session_state.infrahub_url, INFRAHUB_API_TOKEN or None, INFRAHUB_UI_URL)
 
-    # Fetch locations (cache in session state)
-    if "locations" not in st.session_state:
-        with st.spinner("Loading locations..."):
+    # Fetch locations, providers and designs (cache in session state) together
+    # with the active prefixes, all in one GraphQL query on first load
+    form_keys = ("location_map", "provider_map", "design_map", "prefix_map")
+    if not all(key in st.session_state for key in form_keys):
+        with st.spinner("Loading form data..."):
             try:
-                st.session_state.locations = client.get_locations()
+                bootstrap = client.get_form_bootstrap()
             except Exception as e:
                 display_error(
-                    "Unable to load locations",
-                    f"Failed to fetch LocationMetro objects from Infrahub.\n\n{str(e)}",
+                    "Unable to load form data",
+                    "Failed to fetch LocationMetro, OrganizationProvider, DesignTopology "
+                    f"and active IpamPrefix objects from Infrahub.\n\n{str(e)}",
                 )
                 st.stop()
-
-    # Fetch providers (cache in session state)
-    if "providers" not in st.session_state:
-        with st.spinner("Loading providers..."):
+        st.session_state.locations = bootstrap["locations"]
+        st.session_state.providers = bootstrap["providers"]
+        st.session_state.designs = bootstrap["designs"]
+        st.session_state.active_prefixes = bootstrap["active_prefixes"]
+        st.session_state.prefixes_fetched_at = time.monotonic()
+        st.session_state.prefix_map = build_name_id_map(bootstrap["active_prefixes"], attribute="prefix")
+
+        # These lists do not change during the session, so map them only once
+        st.session_state.location_map = build_name_id_map(st.session_state.locations)
+        st.session_state.provider_map = build_name_id_map(st.session_state.providers)
+        st.session_state.design_map = build_name_id_map(st.session_state.designs)
+    elif (
+        st.session_state.get("prefixes_fetched_at") is None
+        or time.monotonic() - st.session_state.prefixes_fetched_at > PREFIX_REFRESH_INTERVAL
+    ):
+        # Refresh active prefixes once they are older than PREFIX_REFRESH_INTERVAL
+        # (or on request), rather than on every widget interaction
+        with st.spinner("Loading active prefixes..."):
             try:
-                st.session_state.providers = client.get_providers()
-            except Exception as e:
-                display_error(
-                    "Unable to load providers",
-                    f"Failed to fetch OrganizationProvider objects from Infrahub.\n\n{str(e)}",
+                st.session_state.active_prefixes = client.get_active_prefixes()
+                st.session_state.prefixes_fetched_at = time.monotonic()
+                st.session_state.prefix_map = build_name_id_map(
+                    st.session_state.active_prefixes, attribute="prefix"
                 )
-                st.stop()
-
-    # Fetch designs (cache in session state)
-    if "designs" not in st.session_state:
-        with st.spinner("Loading designs..."):
-            try:
-                st.session_state.designs = client.get_designs()
             except Exception as e:
                 display_error(
-                    "Unable to load designs",
-                    f"Failed to fetch DesignTopologyDesign objects from Infrahub.\n\n{str(e)}",
+                    "Unable to load active prefixes",
+                    f"Failed to fetch active IpamPrefix objects from Infrahub.\n\n{str(e)}",
                 )
                 st.stop()
 
-    # Fetch active prefixes (always refresh, don't cache)
-    with st.spinner("Loading active prefixes..."):
-        try:
-            st.session_state.active_prefixes = client.get_active_prefixes()
-            if not st.session_state.active_prefixes:
-                st.warning(
-                    "⚠️ No active IpamPrefix objects found in Infrahub. "
-                    "You'll need to create some prefixes with status='active' before creating a datacenter. "
-                    "Querying branch: main"
-                )
-        except Exception as e:
-            display_error(
-                "Unable to load active prefixes",
-                f"Failed to fetch active IpamPrefix objects from Infrahub.\n\n{str(e)}",
-            )
-            st.stop()
+    # Prefix values to IDs (display as "prefix"), rebuilt only when refetched
+    prefix_options = st.session_state.prefix_map
 
-    # Load DC template (cache in session state)
-    if st.session_state.dc_template is None:
-        with st.spinner("Loading DC template..."):
-            st.session_state.dc_template = load_dc_template()
+    if not st.session_state.active_prefixes:
+        st.warning(
+            "⚠️ No active IpamPrefix objects found in Infrahub. "
+            "You'll need to create some prefixes with status='active' before creating a datacenter. "
+            "Querying branch: main"
+        )
+
+    # Load DC template (parsed once per process, see parse_template_file)
+    dc_template = load_dc_template()
 
     # Check if template loaded successfully
-    if st.session_state.dc_template is None:
+    if dc_template is None:
         display_error(
             "Unable to load DC template",
             "The template file /objects/dc/dc-arista-s.yml could not be loaded. "
@@ -572,6 +689,14 @@ def main() -> None:
 
     st.markdown("---")
 
+    # Prefixes are only refetched periodically; let users pick up new ones now
+    st.button(
+        "🔄 Refresh prefixes",
+        help="Reload active prefixes from Infrahub",
+        on_click=expire_active_prefixes,
+        disabled=dc_creation_active,
+    )
+
     with st.form("dc_creation_form"):
         st.subheader("Data Center Information")
 
@@ -589,12 +714,9 @@ def main() -> None:
                 disabled=dc_creation_active,
             )
 
-            # Prepare location options from fetched locations
-            location_names = [loc.get("name", {}).get("value") for loc in st.session_state.locations]
-            location_map = {
-                loc.get("name", {}).get("value"): loc.get("id")
-                for loc in st.session_state.locations
-            }
+            # Location options from the map built after fetching
+            location_map = st.session_state.location_map
+            location_names = list(location_map)
 
             # Pre-select location from template if available
             default_location = template_values.get("location", "") if template_values else ""
@@ -612,24 +734,20 @@ def main() -> None:
             location_id = location_map.get(location_name) if location_name else None
 
             # Pre-select strategy from template if available
-            strategy_options = ["ospf-ibgp", "isis-ibgp", "ospf-ebgp"]
             default_strategy = template_values.get("strategy", "ospf-ibgp") if template_values else "ospf-ibgp"
-            strategy_index = strategy_options.index(default_strategy) if default_strategy in strategy_options else 0
+            strategy_index = STRATEGY_OPTIONS.index(default_strategy) if default_strategy in STRATEGY_OPTIONS else 0
 
             strategy = st.selectbox(
                 "Strategy *",
-                options=strategy_options,
+                options=STRATEGY_OPTIONS,
                 index=strategy_index,
                 help="Routing strategy for the data center",
                 disabled=dc_creation_active,
             )
 
-            # Prepare provider options
-            provider_names = [p.get("name", {}).get("value") for p in st.session_state.providers]
-            provider_map = {
-                p.get("name", {}).get("value"): p.get("id")
-                for p in st.session_state.providers
-            }
+            # Provider options
+            provider_map = st.session_state.provider_map
+            provider_names = list(provider_map)
 
             # Pre-select provider from template if available
             default_provider = template_values.get("provider", "") if template_values else ""
@@ -658,12 +776,9 @@ def main() -> None:
                 disabled=dc_creation_active,
             )
 
-            # Prepare design options
-            design_names = [d.get("name", {}).get("value") for d in st.session_state.designs]
-            design_map = {
-                d.get("name", {}).get("value"): d.get("id")
-                for d in st.session_state.designs
-            }
+            # Design options
+            design_map = st.session_state.design_map
+            design_names = list(design_map)
 
             # Pre-select design from template if available
             default_design = template_values.get("design", "") if template_values else ""
@@ -692,16 +807,6 @@ def main() -> None:
         st.subheader("Subnet Configuration")
         st.markdown("Select existing active prefixes for each subnet type")
 
-        # Prepare prefix options - display as "prefix"
-        prefix_options = {}
-        prefix_map = {}
-        for prefix in st.session_state.active_prefixes:
-            prefix_value = prefix.get("prefix", {}).get("value")
-            prefix_id = prefix.get("id")
-            display_text = prefix_value
-            prefix_options[display_text] = prefix_id
-            prefix_map[prefix_id] = {"prefix": prefix_value}
-
         option_list = list(prefix_options.keys()) if prefix_options else ["No active prefixes available"]
 
         # Extract subnet prefix values from template if available
@@ -719,59 +824,28 @@ def main() -> None:
             tech_subnet_data = template_values.get("technical_subnet_data", {})
             tech_subnet_prefix = tech_subnet_data.get("prefix", "")
 
+        selector_disabled = dc_creation_active or not prefix_options
+
         # Management Subnet
         st.markdown("**Management Subnet**")
-
-        # Find index of management prefix from template
-        mgmt_index = 0
-        if mgmt_subnet_prefix and mgmt_subnet_prefix in option_list:
-            mgmt_index = option_list.index(mgmt_subnet_prefix)
-
-        mgmt_prefix_display = st.selectbox(
-            "Select Management Prefix *",
-            options=option_list,
-            index=mgmt_index,
-            key="mgmt_prefix_select",
-            help="Select an active prefix for management subnet",
-            disabled=dc_creation_active or not prefix_options,
+        mgmt_prefix_id = prefix_selector(
+            "Select Management Prefix *", "mgmt_prefix_select", "management",
+            option_list, prefix_options, mgmt_subnet_prefix, selector_disabled,
         )
-        mgmt_prefix_id = prefix_options.get(mgmt_prefix_display) if prefix_options else None
 
         # Customer Subnet
         st.markdown("**Customer Subnet**")
-
-        # Find index of customer prefix from template
-        cust_index = 0
-        if cust_subnet_prefix and cust_subnet_prefix in option_list:
-            cust_index = option_list.index(cust_subnet_prefix)
-
-        cust_prefix_display = st.selectbox(
-            "Select Customer Prefix *",
-            options=option_list,
-            index=cust_index,
-            key="cust_prefix_select",
-            help="Select an active prefix for customer subnet",
-            disabled=dc_creation_active or not prefix_options,
+        cust_prefix_id = prefix_selector(
+            "Select Customer Prefix *", "cust_prefix_select", "customer",
+            option_list, prefix_options, cust_subnet_prefix, selector_disabled,
         )
-        cust_prefix_id = prefix_options.get(cust_prefix_display) if prefix_options else None
 
         # Technical Subnet
         st.markdown("**Technical Subnet**")
-
-        # Find index of technical prefix from template
-        tech_index = 0
-        if tech_subnet_prefix and tech_subnet_prefix in option_list:
-            tech_index = option_list.index(tech_subnet_prefix)
-
-        tech_prefix_display = st.selectbox(
-            "Select Technical Prefix *",
-            options=option_list,
-            index=tech_index,
-            key="tech_prefix_select",
-            help="Select an active prefix for technical subnet",
-            disabled=dc_creation_active or not prefix_options,
+        tech_prefix_id = prefix_selector(
+            "Select Technical Prefix *", "tech_prefix_select", "technical",
+            option_list, prefix_options, tech_subnet_prefix, selector_disabled,
         )
-        tech_prefix_id = prefix_options.get(tech_prefix_display) if prefix_options else None
 
         # Submit button
         st.markdown("---")
@@ -781,24 +855,17 @@ def main() -> None:
 
         if submitted:
             # Validate required fields
-            errors = []
-
-            if not name:
-                errors.append("Name is required")
-            if not location_id:
-                errors.append("Location is required")
-            if not strategy:
-                errors.append("Strategy is required")
-            if not design_id:
-                errors.append("Design is required")
-            if not provider_id:
-                errors.append("Provider is required")
-            if not mgmt_prefix_id:
-                errors.append("Management subnet is required")
-            if not cust_prefix_id:
-                errors.append("Customer subnet is required")
-            if not tech_prefix_id:
-                errors.append("Technical subnet is required")
+            required_fields = (
+                ("Name", name),
+                ("Location", location_id),
+                ("Strategy", strategy),
+                ("Design", design_id),
+                ("Provider", provider_id),
+                ("Management subnet", mgmt_prefix_id),
+                ("Customer subnet", cust_prefix_id),
+                ("Technical subnet", tech_prefix_id),
+            )
+            errors = [f"{label} is required" for label, value in required_fields if not value]
 
             if errors:
                 display_error(
@@ -819,7 +886,7 @@ def main() -> None:
                     "management_subnet": mgmt_prefix_id,
                     "customer_subnet": cust_prefix_id,
                     "technical_subnet": tech_prefix_id,
-                    "member_of_groups": ["topologies_dc", "topologies_clab"],
+                    "member_of_groups": list(DEFAULT_GROUPS),
                 }
 
                 # Execute DC creation workflow (reuse the client from initialization)
@@ -835,15 +902,15 @@ def main() -> None:
             st.markdown("## 🔄 Datacenter Creation Progress")
             st.markdown("")  # Add spacing
 
-            # Render progress tracker first
-            render_progress_tracker()
+            # Progress tracker first, redrawn in place as each step starts
+            tracker = st.empty()
 
             st.markdown("---")
             st.markdown("### Status Updates")
             st.markdown("")  # Add spacing
 
-            # Execute current step (this will render status widgets below the tracker)
-            execute_dc_creation_step(client)
+            # Execute the workflow (this will render status widgets below the tracker)
+            run_dc_creation_workflow(client, tracker)
 
 
 if __name__ == "__main__":
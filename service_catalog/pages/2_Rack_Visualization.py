@@ -4,18 +4,19 @@ This page provides a visual representation of physical racks and the devices
 mounted within them, similar to NetBox's rack diagram implementation.
 """
 
-import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from typing import Any, Dict, List
+import streamlit as st
 
 from utils import (
     DEFAULT_BRANCH,
     INFRAHUB_ADDRESS,
     INFRAHUB_API_TOKEN,
     INFRAHUB_UI_URL,
-    InfrahubClient,
     display_error,
     display_logo,
+    get_client,
 )
 from utils.api import (
     InfrahubAPIError,
@@ -23,7 +24,7 @@ from utils.api import (
     InfrahubGraphQLError,
     InfrahubHTTPError,
 )
-from utils.rack import generate_rack_html
+from utils.rack import generate_rack_grid_html
 from utils.ui import get_role_legend
 
 
@@ -46,58 +47,125 @@ if "device_label_mode" not in st.session_state:
     st.session_state.device_label_mode = "Hostname"
 
 
-def render_rack_diagram(rack: Dict[str, Any], devices: List[Dict[str, Any]], label_mode: str = "Hostname") -> None:
-    """Render a single rack diagram with devices.
+@st.cache_data(ttl=60, show_spinner=False)
+def load_location_rows(url: str, api_token: Optional[str], branch: str) -> List[Dict[str, Any]]:
+    """Fetch location rows on a branch, cached process-wide for a short TTL.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        branch: Branch name to query
+
+    Returns:
+        List of LocationRow dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_location_rows(branch)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_racks(url: str, api_token: Optional[str], branch: str, row_id: str) -> List[Dict[str, Any]]:
+    """Fetch the racks of a row, cached process-wide for a short TTL.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        branch: Branch name to query
+        row_id: LocationRow ID
+
+    Returns:
+        List of LocationRack dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_racks_by_row(row_id, branch)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_rack_devices(
+    url: str, api_token: Optional[str], branch: str, rack_ids: Tuple[str, ...]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch the devices of a set of racks, cached process-wide for a short TTL.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        branch: Branch name to query
+        rack_ids: LocationRack IDs
+
+    Returns:
+        Dictionary mapping rack ID to its list of DcimDevice dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_devices_by_racks(list(rack_ids), branch)
+
 
-    Generates HTML visualization of the rack and displays it using Streamlit.
+@st.cache_data(ttl=60, show_spinner=False)
+def load_rack_grid_html(
+    racks: List[Dict[str, Any]],
+    rack_devices: Dict[str, List[Dict[str, Any]]],
+    branch: str,
+    label_mode: str,
+) -> str:
+    """Build the rack grid HTML from already-loaded racks and devices.
+
+    The cache is keyed on the data itself, so reruns that only change
+    unrelated UI state reuse the finished HTML instead of regenerating
+    every rack diagram, and the grid always matches the device details.
 
     Args:
-        rack: LocationRack object dictionary
-        devices: List of DcimDevice objects in this rack
+        racks: LocationRack objects, in display order
+        rack_devices: Map of rack ID to the DcimDevice objects in that rack
+        branch: Branch name for device links
         label_mode: Display mode for device labels ("Hostname" or "Device Type")
+
+    Returns:
+        Rack grid HTML with device links to the Infrahub UI on the branch
     """
-    # Generate HTML for rack diagram with Infrahub UI URL and branch
-    rack_html = generate_rack_html(
-        rack,
-        devices,
-        base_url=INFRAHUB_UI_URL,
-        branch=st.session_state.selected_branch,
-        label_mode=label_mode
+    return generate_rack_grid_html(
+        racks, rack_devices, base_url=INFRAHUB_UI_URL, branch=branch, label_mode=label_mode
     )
 
-    # Display using st.markdown with unsafe_allow_html
-    st.markdown(rack_html, unsafe_allow_html=True)
 
-    # Display device count and details
-    device_count = len(devices)
-    if device_count > 0:
-        st.caption(f"{device_count} device(s)")
+def render_device_details(racks: List[Dict[str, Any]], rack_devices: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Render the device list of every non-empty rack in one collapsed expander.
 
-        # Debug info in expander
+    Args:
+        racks: LocationRack objects, in display order
+        rack_devices: Map of rack ID to the DcimDevice objects in that rack
+    """
+    lines = []
+    for rack in racks:
+        devices = rack_devices.get(rack["id"], [])
+        if not devices:
+            continue
+        lines.append(rack.get("name", {}).get("value", "Unknown Rack"))
+        for device in devices:
+            name = device.get("name", {}).get("value", "Unknown")
+            pos = device.get("position", {}).get("value", "N/A")
+            height = device.get("height", {}).get("value", "N/A")
+            lines.append(f"  • {name} - Position: U{pos}, Height: {height}U")
+
+    if lines:
         with st.expander("Device Details"):
-            for i, device in enumerate(devices):
-                name = device.get("name", {}).get("value", "Unknown")
-                pos = device.get("position", {}).get("value", "N/A")
-                height = device.get("height", {}).get("value", "N/A")
-                st.text(f"• {name} - Position: U{pos}, Height: {height}U")
-    else:
-        st.caption("Empty rack")
+            st.text("\n".join(lines))
 
 
-def render_rack_grid(client: InfrahubClient, row_id: str, branch: str, label_mode: str = "Hostname") -> None:
+def render_rack_grid(
+    url: str, api_token: Optional[str], row_id: str, branch: str, label_mode: str = "Hostname"
+) -> None:
     """Render grid of rack diagrams for the selected row.
 
     Fetches all racks for the row and displays them in a responsive grid layout.
-    For each rack, fetches associated devices and renders a rack diagram.
+    Devices for all racks are fetched in a single query, then the racks are
+    rendered as one HTML grid of diagrams.
 
     Args:
-        client: InfrahubClient instance
+        url: Infrahub base URL
+        api_token: Optional API token
         row_id: Selected LocationRow ID
         branch: Selected branch name
+        label_mode: Display mode for device labels ("Hostname" or "Device Type")
     """
     try:
         with st.spinner("Loading racks..."):
-            racks = client.get_racks_by_row(row_id, branch)
+            racks = load_racks(url, api_token, branch, row_id)
 
         if not racks:
             st.info("No racks found in the selected row.")
@@ -107,31 +175,19 @@ def render_rack_grid(client: InfrahubClient, row_id: str, branch: str, label_mod
 
         # Display loading indicator while fetching devices
         with st.spinner("Loading devices..."):
-            # Fetch devices for all racks
-            rack_devices = {}
-            for rack in racks:
-                try:
-                    devices = client.get_devices_by_rack(rack["id"], branch)
-                    rack_devices[rack["id"]] = devices
-                except (InfrahubAPIError, InfrahubConnectionError) as e:
-                    st.warning(
-                        f"Failed to load devices for rack {rack['name']['value']}: {str(e)}"
-                    )
-                    rack_devices[rack["id"]] = []
-
-        # Render racks in columns (max 4 per row)
-        num_cols = min(len(racks), 4)
-        cols = st.columns(num_cols)
-
-        for idx, rack in enumerate(racks):
-            with cols[idx % num_cols]:
-                try:
-                    devices = rack_devices.get(rack["id"], [])
-                    render_rack_diagram(rack, devices, label_mode)
-                except Exception as e:
-                    st.error(
-                        f"Failed to render rack {rack['name']['value']}: {str(e)}"
-                    )
+            # Fetch devices for all racks in one query
+            try:
+                rack_devices = load_rack_devices(url, api_token, branch, tuple(rack["id"] for rack in racks))
+            except InfrahubAPIError as e:
+                st.warning(f"Failed to load devices for the racks in this row: {str(e)}")
+                rack_devices = {}
+
+        grid_html = load_rack_grid_html(racks, rack_devices, branch, label_mode)
+
+        # All racks (max 4 per row) as one markdown element
+        st.markdown(grid_html, unsafe_allow_html=True)
+
+        render_device_details(racks, rack_devices)
 
     except InfrahubConnectionError as e:
         display_error("Unable to connect to Infrahub", str(e))
@@ -148,35 +204,29 @@ def render_rack_grid(client: InfrahubClient, row_id: str, branch: str, label_mod
         display_error("Unexpected error while loading racks", str(e))
 
 
-def render_row_selector(client: InfrahubClient, branch: str) -> str:
+def render_row_selector(url: str, api_token: Optional[str], branch: str) -> str:
     """Render LocationRow dropdown selector.
 
     Fetches all LocationRow objects from Infrahub and displays them in a dropdown.
-    Caches the row list in session state to avoid repeated queries.
+    The row list is cached per branch (see load_location_rows).
 
     Args:
-        client: InfrahubClient instance
+        url: Infrahub base URL
+        api_token: Optional API token
         branch: Selected branch name
 
     Returns:
         Selected row ID or empty string if no selection
     """
-    # Cache key for rows based on branch
-    cache_key = f"location_rows_{branch}"
-
-    # Fetch rows if not cached or branch changed
-    if cache_key not in st.session_state:
-        with st.spinner("Loading location rows..."):
-            try:
-                st.session_state[cache_key] = client.get_location_rows(branch)
-            except (InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError) as e:
-                display_error("Failed to load location rows", str(e))
-                return ""
-            except Exception as e:
-                display_error("Unexpected error loading location rows", str(e))
-                return ""
-
-    rows = st.session_state[cache_key]
+    with st.spinner("Loading location rows..."):
+        try:
+            rows = load_location_rows(url, api_token, branch)
+        except (InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError) as e:
+            display_error("Failed to load location rows", str(e))
+            return ""
+        except Exception as e:
+            display_error("Unexpected error loading location rows", str(e))
+            return ""
 
     if not rows:
         st.warning(
@@ -185,23 +235,20 @@ def render_row_selector(client: InfrahubClient, branch: str) -> str:
         )
         return ""
 
-    # Prepare row options
-    row_names = [row.get("name", {}).get("value", "Unknown") for row in rows]
-    row_map = {
-        row.get("name", {}).get("value", "Unknown"): row.get("id")
-        for row in rows
-    }
+    # Row options as (name, id) pairs, so rows sharing a name stay distinct
+    row_options = [(row.get("name", {}).get("value", "Unknown"), row["id"]) for row in rows]
 
     # Display row selector
-    selected_row_name = st.selectbox(
+    selected_row = st.selectbox(
         "Select Location Row",
-        options=row_names,
+        options=row_options,
+        format_func=lambda option: option[0],
         help="Choose a row to view its racks and devices",
         key="row_selector",
     )
 
     # Return selected row ID
-    return row_map.get(selected_row_name, "")
+    return selected_row[1] if selected_row else ""
 
 
 def render_legend() -> None:
@@ -245,12 +292,10 @@ def main() -> None:
     # Display logo in sidebar
     display_logo()
 
-    # Initialize API client
-    client = InfrahubClient(
-        st.session_state.infrahub_url,
-        api_token=INFRAHUB_API_TOKEN or None,
-        ui_url=INFRAHUB_UI_URL
-    )
+    # Shared API client and the connection settings the cached loaders key on
+    url = st.session_state.infrahub_url
+    api_token = INFRAHUB_API_TOKEN or None
+    client = get_client(url, api_token, INFRAHUB_UI_URL)
 
     # Page title
     st.title("Rack Visualization")
@@ -263,9 +308,12 @@ def main() -> None:
     st.sidebar.subheader("Branch Selection")
 
     try:
-        # Fetch branches (cache in session state to avoid repeated API calls)
+        # Fetch branches (cache in session state to avoid repeated API calls).
+        # Rows for the current branch load into their cache at the same time;
+        # a failure there is reported later by the row selector.
         if "branches" not in st.session_state:
-            with st.spinner("Loading branches..."):
+            with st.spinner("Loading branches..."), ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(load_location_rows, url, api_token, st.session_state.selected_branch)
                 st.session_state.branches = client.get_branches()
 
         branches = st.session_state.branches
@@ -292,15 +340,9 @@ def main() -> None:
                 key="branch_selector_rack_viz",
             )
 
-            # Update session state if branch changed
+            # Update session state if branch changed (cached data is keyed by branch)
             if selected_branch != st.session_state.selected_branch:
                 st.session_state.selected_branch = selected_branch
-                # Clear cached row data when branch changes
-                keys_to_clear = [
-                    key for key in st.session_state.keys() if key.startswith("location_rows_")
-                ]
-                for key in keys_to_clear:
-                    del st.session_state[key]
                 st.rerun()
         else:
             st.sidebar.warning("No branches found")
@@ -320,8 +362,11 @@ def main() -> None:
         display_error("Unexpected error while fetching branches", str(e))
         st.stop()
 
+    # Branch is settled for the rest of this run
+    branch = st.session_state.selected_branch
+
     # Display current branch info
-    st.sidebar.info(f"Current Branch: **{st.session_state.selected_branch}**")
+    st.sidebar.info(f"Current Branch: **{branch}**")
 
     # Device label mode selector
     st.sidebar.markdown("---")
@@ -341,9 +386,7 @@ def main() -> None:
 
     # Row selector
     st.markdown("---")
-    selected_row_id = render_row_selector(
-        client, st.session_state.selected_branch
-    )
+    selected_row_id = render_row_selector(url, api_token, branch)
 
     if not selected_row_id:
         st.info("👆 Select a location row above to view racks.")
@@ -351,7 +394,7 @@ def main() -> None:
 
     # Render rack grid
     st.markdown("---")
-    render_rack_grid(client, selected_row_id, st.session_state.selected_branch, st.session_state.device_label_mode)
+    render_rack_grid(url, api_token, selected_row_id, branch, device_label_mode)
 
     # Render legend
     st.markdown("---")
@@ -361,8 +404,8 @@ def main() -> None:
     # Footer
     st.markdown("---")
     st.markdown(
-        f"Connected to Infrahub at `{st.session_state.infrahub_url}` | "
-        f"Branch: `{st.session_state.selected_branch}`"
+        f"Connected to Infrahub at `{url}` | "
+        f"Branch: `{branch}`"
     )
 
 
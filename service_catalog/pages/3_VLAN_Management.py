@@ -6,7 +6,7 @@ on customer-facing ports of leaf switches.
 
 import streamlit as st
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from utils import (
     INFRAHUB_ADDRESS,
@@ -17,6 +17,7 @@ from utils import (
     display_logo,
     display_progress,
     display_success,
+    get_client,
 )
 from utils.api import (
     InfrahubAPIError,
@@ -39,11 +40,123 @@ if "infrahub_url" not in st.session_state:
     st.session_state.infrahub_url = INFRAHUB_ADDRESS
 
 
-def render_location_selectors(client: InfrahubClient) -> Dict[str, Optional[str]]:
+@st.cache_data(ttl=60, show_spinner=False)
+def load_buildings(url: str, api_token: Optional[str]) -> List[Dict[str, Any]]:
+    """Fetch LocationBuilding objects on main, cached process-wide for a short TTL.
+
+    Changing a selector further down the form does not query Infrahub for
+    the selectors above it again; the same holds for the loaders below.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+
+    Returns:
+        List of building dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_location_buildings("main")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_pods(url: str, api_token: Optional[str], building_id: str) -> List[Dict[str, Any]]:
+    """Fetch the pods of a building on main, cached process-wide for a short TTL.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        building_id: LocationBuilding ID
+
+    Returns:
+        List of pod dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_pods_by_building(building_id, "main")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_racks(url: str, api_token: Optional[str], pod_id: str) -> List[Dict[str, Any]]:
+    """Fetch the racks of a pod on main, cached process-wide for a short TTL.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        pod_id: LocationPod ID
+
+    Returns:
+        List of rack dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_racks_by_pod(pod_id, "main")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_devices(
+    url: str, api_token: Optional[str], pod_id: str, rack_id: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Fetch the devices of a pod, or of one rack in it, on main (cached).
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        pod_id: LocationPod ID
+        rack_id: Optional LocationRack ID to narrow the search
+
+    Returns:
+        List of device dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_devices_by_location(pod_id, rack_id, "main")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_customer_interfaces(url: str, api_token: Optional[str], device_id: str) -> List[Dict[str, Any]]:
+    """Fetch the customer-facing interfaces of a device on main (cached).
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        device_id: DcimDevice ID
+
+    Returns:
+        List of interface dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_interfaces_by_device(
+        device_id, role_filter="Customer", branch="main"
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_interface_vlans(url: str, api_token: Optional[str], interface_id: str) -> List[Dict[str, Any]]:
+    """Fetch the VLANs assigned to an interface on main (cached).
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        interface_id: Interface ID
+
+    Returns:
+        List of VLAN dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_vlans_by_interface(interface_id, "main")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_vlans(url: str, api_token: Optional[str]) -> List[Dict[str, Any]]:
+    """Fetch all VLANs on main, cached process-wide for a short TTL.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+
+    Returns:
+        List of VLAN dictionaries
+    """
+    return get_client(url, api_token, INFRAHUB_UI_URL).get_all_vlans("main")
+
+
+def render_location_selectors(url: str, api_token: Optional[str]) -> Dict[str, Optional[str]]:
     """Render hierarchical location selector dropdowns.
 
     Args:
-        client: InfrahubClient instance
+        url: Infrahub base URL
+        api_token: Optional API token
 
     Returns:
         Dictionary with selected IDs:
@@ -64,19 +177,15 @@ def render_location_selectors(client: InfrahubClient) -> Dict[str, Optional[str]
     st.markdown("### 📍 Location Selection")
 
     # Building selector
-    cache_key = "location_buildings_main"
-    if cache_key not in st.session_state:
-        with st.spinner("Loading buildings..."):
-            try:
-                st.session_state[cache_key] = client.get_location_buildings("main")
-            except (InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError) as e:
-                display_error("Failed to load buildings", str(e))
-                return selections
-            except Exception as e:
-                display_error("Unexpected error loading buildings", str(e))
-                return selections
-
-    buildings = st.session_state[cache_key]
+    with st.spinner("Loading buildings..."):
+        try:
+            buildings = load_buildings(url, api_token)
+        except (InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError) as e:
+            display_error("Failed to load buildings", str(e))
+            return selections
+        except Exception as e:
+            display_error("Unexpected error loading buildings", str(e))
+            return selections
 
     if not buildings:
         st.warning("No buildings found. Please create LocationBuilding objects in Infrahub.")
@@ -102,7 +211,7 @@ def render_location_selectors(client: InfrahubClient) -> Dict[str, Optional[str]
 
         with st.spinner("Loading pods..."):
             try:
-                pods = client.get_pods_by_building(building_id, "main")
+                pods = load_pods(url, api_token, building_id)
             except (InfrahubAPIError, InfrahubConnectionError) as e:
                 display_error("Failed to load pods", str(e))
                 return selections
@@ -131,7 +240,7 @@ def render_location_selectors(client: InfrahubClient) -> Dict[str, Optional[str]
 
             with st.spinner("Loading racks..."):
                 try:
-                    racks = client.get_racks_by_pod(pod_id, "main")
+                    racks = load_racks(url, api_token, pod_id)
                 except (InfrahubAPIError, InfrahubConnectionError) as e:
                     display_error("Failed to load racks", str(e))
                     return selections
@@ -152,11 +261,7 @@ def render_location_selectors(client: InfrahubClient) -> Dict[str, Optional[str]
             # Device selector
             with st.spinner("Loading devices..."):
                 try:
-                    devices = client.get_devices_by_location(
-                        pod_id,
-                        selections["rack_id"],
-                        "main"
-                    )
+                    devices = load_devices(url, api_token, pod_id, selections["rack_id"])
                 except (InfrahubAPIError, InfrahubConnectionError) as e:
                     display_error("Failed to load devices", str(e))
                     return selections
@@ -182,14 +287,16 @@ def render_location_selectors(client: InfrahubClient) -> Dict[str, Optional[str]
 
 
 def render_interface_selector(
-    client: InfrahubClient,
+    url: str,
+    api_token: Optional[str],
     device_id: str,
     device_name: str
 ) -> Optional[Dict[str, Any]]:
     """Render interface dropdown filtered to customer interfaces.
 
     Args:
-        client: InfrahubClient instance
+        url: Infrahub base URL
+        api_token: Optional API token
         device_id: Selected device ID
         device_name: Selected device name for display
 
@@ -205,11 +312,7 @@ def render_interface_selector(
 
     with st.spinner("Loading interfaces..."):
         try:
-            interfaces = client.get_interfaces_by_device(
-                device_id,
-                role_filter="Customer",
-                branch="main"
-            )
+            interfaces = load_customer_interfaces(url, api_token, device_id)
         except (InfrahubAPIError, InfrahubConnectionError) as e:
             display_error("Failed to load interfaces", str(e))
             return None
@@ -246,20 +349,22 @@ def render_interface_selector(
 
 
 def render_current_vlans(
-    client: InfrahubClient,
+    url: str,
+    api_token: Optional[str],
     interface_id: str
 ) -> None:
     """Display current VLAN assignments for the interface.
 
     Args:
-        client: InfrahubClient instance
+        url: Infrahub base URL
+        api_token: Optional API token
         interface_id: Selected interface ID
     """
     st.markdown("**Current VLAN Assignments:**")
 
     with st.spinner("Loading current VLANs..."):
         try:
-            current_vlans = client.get_vlans_by_interface(interface_id, "main")
+            current_vlans = load_interface_vlans(url, api_token, interface_id)
         except (InfrahubAPIError, InfrahubConnectionError) as e:
             display_error("Failed to load current VLANs", str(e))
             return
@@ -273,11 +378,12 @@ def render_current_vlans(
             st.markdown(f"• VLAN {vlan_id} - {vlan_name}")
 
 
-def render_vlan_selector(client: InfrahubClient) -> Optional[Dict[str, Any]]:
+def render_vlan_selector(url: str, api_token: Optional[str]) -> Optional[Dict[str, Any]]:
     """Render VLAN dropdown with all available VLANs.
 
     Args:
-        client: InfrahubClient instance
+        url: Infrahub base URL
+        api_token: Optional API token
 
     Returns:
         Dictionary with VLAN info or None:
@@ -289,20 +395,15 @@ def render_vlan_selector(client: InfrahubClient) -> Optional[Dict[str, Any]]:
     """
     st.markdown("### 🏷️ New VLAN Assignment")
 
-    # Cache VLANs
-    cache_key = "all_vlans_main"
-    if cache_key not in st.session_state:
-        with st.spinner("Loading VLANs..."):
-            try:
-                st.session_state[cache_key] = client.get_all_vlans("main")
-            except (InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError) as e:
-                display_error("Failed to load VLANs", str(e))
-                return None
-            except Exception as e:
-                display_error("Unexpected error loading VLANs", str(e))
-                return None
-
-    vlans = st.session_state[cache_key]
+    with st.spinner("Loading VLANs..."):
+        try:
+            vlans = load_vlans(url, api_token)
+        except (InfrahubConnectionError, InfrahubHTTPError, InfrahubGraphQLError) as e:
+            display_error("Failed to load VLANs", str(e))
+            return None
+        except Exception as e:
+            display_error("Unexpected error loading VLANs", str(e))
+            return None
 
     if not vlans:
         st.warning("No VLANs found. Please create InterfaceVirtual objects in Infrahub.")
@@ -431,12 +532,11 @@ def main() -> None:
     # Display logo in sidebar
     display_logo()
 
-    # Initialize API client (always use "main" branch)
-    client = InfrahubClient(
-        st.session_state.infrahub_url,
-        api_token=INFRAHUB_API_TOKEN or None,
-        ui_url=INFRAHUB_UI_URL
-    )
+    # Shared API client and the connection settings the cached loaders key
+    # on (always use "main" branch)
+    url = st.session_state.infrahub_url
+    api_token = INFRAHUB_API_TOKEN or None
+    client = get_client(url, api_token, INFRAHUB_UI_URL)
 
     # Page title
     st.title("VLAN Management")
@@ -458,7 +558,7 @@ def main() -> None:
 
     # Render location selectors
     st.markdown("---")
-    location_selections = render_location_selectors(client)
+    location_selections = render_location_selectors(url, api_token)
     
     # Update progress
     if location_selections.get("building_id"):
@@ -486,7 +586,7 @@ def main() -> None:
         st.markdown("---")
 
         # Render interface selector
-        interface_info = render_interface_selector(client, device_id, device_name)
+        interface_info = render_interface_selector(url, api_token, device_id, device_name)
 
         if interface_info:
             interface_id = interface_info["id"]
@@ -496,12 +596,12 @@ def main() -> None:
             st.markdown("---")
             
             # Display current VLANs
-            render_current_vlans(client, interface_id)
+            render_current_vlans(url, api_token, interface_id)
 
             st.markdown("---")
             
             # Render VLAN selector
-            vlan_info = render_vlan_selector(client)
+            vlan_info = render_vlan_selector(url, api_token)
 
             if vlan_info:
                 progress_steps["VLAN"] = True
@@ -548,7 +648,7 @@ def main() -> None:
     # Footer
     st.markdown("---")
     st.markdown(
-        f"Connected to Infrahub at `{st.session_state.infrahub_url}` | "
+        f"Connected to Infrahub at `{url}` | "
         f"Branch: `main`"
     )
 
@@ -0,0 +1,194 @@
+"""Unit tests for Create DC page API client methods."""
+
+import json
+import ssl
+
+# Mock the imports to avoid dependency issues in tests
+import sys
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+sys.path.insert(0, '../../')
+
+from infrahub_sdk import Config
+from infrahub_sdk.types import HTTPMethod
+from utils.api import (
+    InfrahubClient,
+    InfrahubGraphQLError,
+    pooled_http_client,
+    pooled_sync_requester,
+)
+
+
+class TestFormBootstrap:
+    """Test the combined form bootstrap query."""
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_form_bootstrap_success(self, mock_sdk: Mock) -> None:
+        """Test that all form lists come back from a single query."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {
+            "LocationMetro": {
+                "edges": [{"node": {"id": "loc-1", "name": {"value": "Paris"}}}]
+            },
+            "OrganizationProvider": {
+                "edges": [{"node": {"id": "prov-1", "name": {"value": "Equinix"}}}]
+            },
+            "DesignTopology": {
+                "edges": [{"node": {"id": "design-1", "name": {"value": "S"}}}]
+            },
+            "IpamPrefix": {
+                "edges": [
+                    {
+                        "node": {
+                            "id": "prefix-1",
+                            "prefix": {"value": "10.0.0.0/24"},
+                            "status": {"value": "active"}
+                        }
+                    }
+                ]
+            },
+        }
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+        bootstrap = client.get_form_bootstrap("main")
+
+        assert bootstrap["locations"] == [{"id": "loc-1", "name": {"value": "Paris"}}]
+        assert bootstrap["providers"] == [{"id": "prov-1", "name": {"value": "Equinix"}}]
+        assert bootstrap["designs"] == [{"id": "design-1", "name": {"value": "S"}}]
+        assert bootstrap["active_prefixes"][0]["prefix"]["value"] == "10.0.0.0/24"
+        mock_client_instance.execute_graphql.assert_called_once()
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_form_bootstrap_missing_kinds(self, mock_sdk: Mock) -> None:
+        """Test that kinds absent from the response come back as empty lists."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {}
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+        bootstrap = client.get_form_bootstrap("main")
+
+        assert bootstrap == {
+            "locations": [],
+            "providers": [],
+            "designs": [],
+            "active_prefixes": [],
+        }
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_form_bootstrap_error(self, mock_sdk: Mock) -> None:
+        """Test that query failures surface as InfrahubGraphQLError."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.side_effect = Exception("boom")
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+
+        with pytest.raises(InfrahubGraphQLError) as exc_info:
+            client.get_form_bootstrap("main")
+
+        assert "boom" in str(exc_info.value)
+
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_active_prefixes_success(self, mock_sdk: Mock) -> None:
+        """Test that active prefixes come back with id, prefix and status."""
+        node = {"id": "prefix-1", "prefix": {"value": "10.0.0.0/24"}, "status": {"value": "active"}}
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {"IpamPrefix": {"edges": [{"node": node}]}}
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+
+        assert client.get_active_prefixes("main") == [node]
+
+
+class TestGeneratorStatus:
+    """Test generator status polling."""
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_generator_statuses_success(self, mock_sdk: Mock) -> None:
+        """Test that statuses of all generator instances are returned."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {
+            "CoreGeneratorInstance": {
+                "edges": [
+                    {"node": {"status": {"value": "ready"}}},
+                    {"node": {"status": {"value": "processing"}}},
+                ]
+            }
+        }
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+        statuses = client.get_generator_statuses("dc-1", "add-dc-4")
+
+        assert statuses == ["ready", "processing"]
+        call_kwargs = mock_client_instance.execute_graphql.call_args.kwargs
+        assert call_kwargs["variables"] == {"ids": ["dc-1"]}
+        assert call_kwargs["branch_name"] == "add-dc-4"
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_generator_statuses_not_scheduled(self, mock_sdk: Mock) -> None:
+        """Test that no generator instances yields an empty list."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {
+            "CoreGeneratorInstance": {"edges": []}
+        }
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+
+        assert client.get_generator_statuses("dc-1", "add-dc-4") == []
+
+
+class TestPooledRequester:
+    """Test the requester the SDK sends its HTTP calls through."""
+
+    @patch('utils.api.httpx.Client')
+    def test_pooled_client_uses_config_tls_and_proxy(self, mock_http_client: Mock) -> None:
+        """Test that the pooled client gets the SDK's TLS context and proxy."""
+        config = Config(tls_insecure=True, proxy="http://proxy.example:3128")
+
+        pooled_http_client(config)
+
+        call_kwargs = mock_http_client.call_args.kwargs
+        assert isinstance(call_kwargs["verify"], ssl.SSLContext)
+        assert call_kwargs["verify"].verify_mode == ssl.CERT_NONE
+        assert call_kwargs["proxy"] == "http://proxy.example:3128"
+
+    @patch('utils.api.httpx.Client')
+    def test_client_builds_pool_from_its_config(self, mock_http_client: Mock) -> None:
+        """Test that InfrahubClient passes its Config's TLS context to the pool."""
+        InfrahubClient("https://infrahub.example")
+
+        assert isinstance(mock_http_client.call_args.kwargs["verify"], ssl.SSLContext)
+
+    def test_payload_is_sent_as_json(self) -> None:
+        """Test that the payload arrives as the same JSON document."""
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["body"] = json.loads(request.content)
+            seen["content_type"] = request.headers.get("content-type")
+            return httpx.Response(200, json={"data": {}})
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        requester = pooled_sync_requester(http_client)
+        payload = {"query": "query { CoreProposedChange { count } }", "variables": {"ids": ["dc-1"]}}
+
+        response = requester(
+            url="http://localhost:8000/graphql/main",
+            method=HTTPMethod.POST,
+            headers={"content-type": "application/json"},
+            timeout=10,
+            payload=payload,
+        )
+
+        assert response.status_code == 200
+        assert seen["body"] == payload
+        assert seen["content_type"] == "application/json"
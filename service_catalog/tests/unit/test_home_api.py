@@ -0,0 +1,161 @@
+"""Unit tests for Home page API client methods."""
+
+# Mock the imports to avoid dependency issues in tests
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, '../../')
+
+from utils.api import InfrahubAPIError, InfrahubClient
+
+HOME_PAGE = Path(__file__).resolve().parents[2] / "Home.py"
+
+
+class TestTopologyMethods:
+    """Test the data center and colocation center queries."""
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_datacenters_success(self, mock_sdk: Mock) -> None:
+        """Test that data centers keep the table's nested field structure."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {
+            "TopologyDataCenter": {
+                "edges": [
+                    {
+                        "node": {
+                            "id": "dc-1",
+                            "name": {"value": "DC-1"},
+                            "description": {"value": None},
+                            "strategy": {"value": "ebgp-ibgp"},
+                            "location": {"node": {"id": "loc-1", "display_label": "Paris"}},
+                            "design": {"node": {"id": "design-1", "name": {"value": "S"}}},
+                        }
+                    },
+                    {
+                        "node": {
+                            "id": "dc-2",
+                            "name": {"value": "DC-2"},
+                            "description": {"value": "Lab"},
+                            "strategy": {"value": "ospf-ibgp"},
+                            "location": {"node": None},
+                            "design": {"node": None},
+                        }
+                    },
+                ]
+            }
+        }
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+        datacenters = client.get_datacenters("main")
+
+        assert datacenters[0] == {
+            "id": "dc-1",
+            "name": {"value": "DC-1"},
+            "description": {"value": None},
+            "strategy": {"value": "ebgp-ibgp"},
+            "location": {"node": {"id": "loc-1", "display_label": "Paris"}},
+            "design": {"node": {"id": "design-1", "name": {"value": "S"}}},
+        }
+        assert "location" not in datacenters[1]
+        assert "design" not in datacenters[1]
+        mock_client_instance.filters.assert_not_called()
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_colocation_centers_provider_label(self, mock_sdk: Mock) -> None:
+        """Test that the provider relationship is reported by its label."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {
+            "TopologyColocationCenter": {
+                "edges": [
+                    {
+                        "node": {
+                            "id": "colo-1",
+                            "name": {"value": "COLO-1"},
+                            "description": {"value": None},
+                            "location": {"node": None},
+                            "provider": {"node": {"display_label": "Equinix"}},
+                        }
+                    }
+                ]
+            }
+        }
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+        colocations = client.get_colocation_centers("main")
+
+        assert colocations[0]["provider"] == {"value": "Equinix"}
+        assert "location" not in colocations[0]
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_datacenters_error(self, mock_sdk: Mock) -> None:
+        """Test that query failures surface as InfrahubAPIError."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.side_effect = Exception("boom")
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+
+        with pytest.raises(InfrahubAPIError) as exc_info:
+            client.get_datacenters("main")
+
+        assert "boom" in str(exc_info.value)
+        # The SDK exception stays reachable through the exception chain
+        cause = exc_info.value.__cause__
+        assert cause is not None
+        assert str(cause.__cause__) == "boom"
+
+
+class TestBranchMethods:
+    """Test the branch list query."""
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_branches_success(self, mock_sdk: Mock) -> None:
+        """Test that branches come back with the fields the selectors use."""
+        branch = {"id": "branch-1", "name": "main", "is_default": True, "sync_with_git": True}
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {"Branch": [branch]}
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+
+        assert client.get_branches() == [branch]
+        mock_client_instance.branch.all.assert_not_called()
+
+
+class TestHomePageErrors:
+    """Test that the landing page reports failed loads instead of crashing."""
+
+    def setup_method(self) -> None:
+        # Loaders are cached across app runs in the same process
+        st.cache_data.clear()
+
+    @patch('utils.api.InfrahubClient.get_objects')
+    @patch('utils.api.InfrahubClient.get_branches')
+    def test_section_loader_error(self, mock_branches: Mock, mock_objects: Mock) -> None:
+        """Test that an InfrahubAPIError from a section loader renders an error box."""
+        mock_branches.return_value = [{"id": "branch-1", "name": "main"}]
+        mock_objects.side_effect = InfrahubAPIError("Failed to fetch datacenters: boom")
+
+        at = AppTest.from_file(str(HOME_PAGE), default_timeout=30).run()
+
+        assert not at.exception
+        errors = [error.value for error in at.error]
+        assert any("Failed to fetch data centers" in error for error in errors)
+        assert any("Failed to fetch colocation centers" in error for error in errors)
+
+    @patch('utils.api.InfrahubClient.get_branches')
+    def test_branch_loader_error(self, mock_branches: Mock) -> None:
+        """Test that an InfrahubAPIError from the branch list renders an error box."""
+        mock_branches.side_effect = InfrahubAPIError("Failed to fetch branches: boom")
+
+        at = AppTest.from_file(str(HOME_PAGE), default_timeout=30).run()
+
+        assert not at.exception
+        assert any("Failed to fetch branches" in error.value for error in at.error)
@@ -0,0 +1,85 @@
+"""Unit tests for Rack Visualization page API client methods."""
+
+# Mock the imports to avoid dependency issues in tests
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, '../../')
+
+from utils.api import InfrahubAPIError, InfrahubClient
+
+
+def device_edge(device_id: str, rack_id: str, height: int = 1) -> dict:
+    """Build a DcimDevice edge as returned by the rack device query."""
+    return {
+        "node": {
+            "id": device_id,
+            "name": {"value": f"sw-{device_id}"},
+            "position": {"value": 10},
+            "role": {"value": "leaf"},
+            "device_type": {
+                "node": {"name": {"value": "DCS-7280"}, "height": {"value": height}}
+            },
+            "location": {"node": {"id": rack_id}},
+        }
+    }
+
+
+class TestDevicesByRacks:
+    """Test the batched rack device query."""
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_devices_by_racks_groups_by_rack(self, mock_sdk: Mock) -> None:
+        """Test that devices from one query are grouped per rack."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {
+            "DcimDevice": {
+                "edges": [
+                    device_edge("dev-1", "rack-1"),
+                    device_edge("dev-2", "rack-2", height=2),
+                    device_edge("dev-3", "rack-1"),
+                ]
+            }
+        }
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+        devices = client.get_devices_by_racks(["rack-1", "rack-2", "rack-3"], "main")
+
+        assert [d["id"] for d in devices["rack-1"]] == ["dev-1", "dev-3"]
+        assert devices["rack-2"][0]["height"] == {"value": 2}
+        assert devices["rack-2"][0]["device_type"] == {"value": "DCS-7280"}
+        assert "rack-3" not in devices
+        mock_client_instance.execute_graphql.assert_called_once()
+        call_kwargs = mock_client_instance.execute_graphql.call_args.kwargs
+        assert call_kwargs["variables"] == {"rack_ids": ["rack-1", "rack-2", "rack-3"]}
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_devices_by_rack_uses_batched_query(self, mock_sdk: Mock) -> None:
+        """Test that the single-rack helper returns that rack's devices."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.return_value = {
+            "DcimDevice": {"edges": [device_edge("dev-1", "rack-1")]}
+        }
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+
+        assert [d["id"] for d in client.get_devices_by_rack("rack-1", "main")] == ["dev-1"]
+        assert client.get_devices_by_rack("rack-2", "main") == []
+
+    @patch('utils.api.InfrahubClientSync')
+    def test_get_devices_by_racks_error(self, mock_sdk: Mock) -> None:
+        """Test that query failures surface as InfrahubAPIError."""
+        mock_client_instance = Mock()
+        mock_client_instance.execute_graphql.side_effect = Exception("boom")
+        mock_sdk.return_value = mock_client_instance
+
+        client = InfrahubClient("http://localhost:8000")
+
+        with pytest.raises(InfrahubAPIError) as exc_info:
+            client.get_devices_by_racks(["rack-1"], "main")
+
+        assert "boom" in str(exc_info.value)
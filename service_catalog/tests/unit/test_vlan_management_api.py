@@ -306,6 +306,7 @@ class TestVLANMethods:
 
         assert len(vlans) == 1
         assert vlans[0]["vlan_id"]["value"] == 100
+        assert mock_client_instance.filters.call_args.kwargs["parallel"] is True
 
     @patch('utils.api.InfrahubClientSync')
     def test_assign_vlan_to_interface_success(self, mock_sdk: Mock) -> None:
@@ -1,6 +1,7 @@
 """Utility modules for the Infrahub Service Catalog."""
 
 from .api import InfrahubClient
+from .client import get_client
 from .config import (
     API_RETRY_COUNT,
     API_TIMEOUT,
@@ -25,6 +26,7 @@ from .ui import (
 
 __all__ = [
     "InfrahubClient",
+    "get_client",
     "INFRAHUB_ADDRESS",
     "INFRAHUB_API_TOKEN",
     "INFRAHUB_UI_URL",
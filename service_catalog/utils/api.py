@@ -2,7 +2,14 @@
 
 from typing import Any, Dict, List, Optional
 
+import httpx
+import orjson
 from infrahub_sdk import Config, InfrahubClientSync
+from infrahub_sdk.exceptions import ServerNotReachableError, ServerNotResponsiveError
+from infrahub_sdk.types import HTTPMethod, SyncRequester
+
+# Connection pool limits for the long-lived HTTP client behind each InfrahubClient
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
 
 
 class InfrahubAPIError(Exception):
@@ -34,10 +41,86 @@ class InfrahubGraphQLError(InfrahubAPIError):
         self.errors = errors
 
 
+def pooled_http_client(config: Config) -> httpx.Client:
+    """Build the long-lived httpx client behind an SDK sync requester.
+
+    Applies the same TLS and proxy settings from the SDK Config as the
+    SDK's default requester, so a custom CA, tls_insecure or a proxy keep
+    working with the pooled client.
+
+    Args:
+        config: SDK Config holding the TLS and proxy settings
+
+    Returns:
+        httpx.Client with the shared connection pool limits
+    """
+    proxy: Optional[str] = None
+    mounts: Optional[Dict[str, httpx.HTTPTransport]] = None
+    if config.proxy:
+        proxy = config.proxy
+    elif config.proxy_mounts.is_set:
+        mounts = {
+            key: httpx.HTTPTransport(proxy=value)
+            for key, value in config.proxy_mounts.model_dump(by_alias=True).items()
+        }
+
+    return httpx.Client(
+        limits=HTTP_LIMITS, verify=config.tls_context, proxy=proxy, mounts=mounts
+    )
+
+
+def pooled_sync_requester(http_client: httpx.Client) -> SyncRequester:
+    """Build an SDK sync requester that sends every request through one httpx pool.
+
+    The SDK's default requester opens a new httpx client (and TCP connection)
+    per request; this one reuses keep-alive connections instead. Payloads
+    are encoded with orjson. Transport errors map to the same SDK exceptions
+    as the default requester.
+
+    Args:
+        http_client: Long-lived httpx.Client owning the connection pool
+
+    Returns:
+        Requester suitable for Config(sync_requester=...)
+    """
+
+    def request(
+        url: str,
+        method: HTTPMethod,
+        headers: Dict[str, Any],
+        timeout: int,
+        payload: Optional[Dict] = None,
+    ) -> httpx.Response:
+        # The SDK sets the JSON content-type header itself
+        content = orjson.dumps(payload) if payload is not None else None
+
+        try:
+            return http_client.request(
+                method=method.value,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                content=content,
+            )
+        except httpx.NetworkError as exc:
+            raise ServerNotReachableError(address=url) from exc
+        except httpx.ReadTimeout as exc:
+            raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
+
+    return request
+
+
 class InfrahubClient:
     """Client for interacting with the Infrahub API using the official SDK."""
 
-    def __init__(self, base_url: str, api_token: Optional[str] = None, timeout: int = 30, ui_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_token: Optional[str] = None,
+        timeout: int = 30,
+        ui_url: Optional[str] = None,
+        pagination_size: int = 50,
+    ):
         """Initialize the Infrahub API client.
 
         Args:
@@ -45,14 +128,24 @@ class InfrahubClient:
             api_token: Optional API token for authentication (not currently used by SDK)
             timeout: Request timeout in seconds (default: 30)
             ui_url: Optional UI URL for generating browser links (defaults to base_url if not provided)
+            pagination_size: Objects per page when listing a kind through the SDK (default: 50)
         """
         self.base_url = base_url.rstrip("/")
         self.ui_url = (ui_url or base_url).rstrip("/")
         self.api_token = api_token
         self.timeout = timeout
 
-        # Initialize the official Infrahub SDK client
-        config = Config(timeout=timeout, api_token=api_token)
+        # Initialize the official Infrahub SDK client on top of a pooled HTTP
+        # client, so a long-lived InfrahubClient keeps its connections warm.
+        # The pool is built from the Config so it honours its TLS and proxy
+        # settings.
+        config = Config(
+            timeout=timeout,
+            api_token=api_token,
+            pagination_size=pagination_size,
+        )
+        self._http = pooled_http_client(config)
+        config.sync_requester = pooled_sync_requester(self._http)
         self._client = InfrahubClientSync(address=base_url, config=config)
 
     def get_branches(self) -> List[Dict[str, Any]]:
@@ -66,19 +159,14 @@ class InfrahubClient:
             InfrahubAPIError: If API error occurs
         """
         try:
-            branches_dict = self._client.branch.all()
-            # Convert to list of dicts for compatibility
-            branches = []
-            for branch_name, branch_data in branches_dict.items():
-                branches.append({
-                    "name": branch_name,
-                    "id": branch_data.id,
-                    "is_default": branch_data.is_default,
-                    "sync_with_git": branch_data.sync_with_git,
-                })
-            return branches
+            # Only the fields the branch selectors use, instead of the SDK's
+            # full branch records
+            result = self._client.execute_graphql(
+                query="query GetBranches { Branch { id name is_default sync_with_git } }"
+            )
+            return result.get("Branch", [])
         except Exception as e:
-            raise InfrahubConnectionError(f"Failed to fetch branches: {str(e)}")
+            raise InfrahubConnectionError(f"Failed to fetch branches: {str(e)}") from e
 
     def get_objects(
         self, object_type: str, branch: str = "main"
@@ -102,17 +190,21 @@ class InfrahubClient:
         elif object_type == "TopologyColocationCenter":
             return self.get_colocation_centers(branch)
 
-        # Generic query for other types
+        # Generic query for other types; the kind may span many pages, so
+        # fetch them concurrently
         try:
-            objects = self._client.filters(kind=object_type, branch=branch)
+            objects = self._client.filters(kind=object_type, branch=branch, parallel=True)
             # Convert SDK objects to dicts
             return [self._sdk_object_to_dict(obj) for obj in objects]
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch {object_type}: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch {object_type}: {str(e)}") from e
 
     def get_datacenters(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch TopologyDataCenter objects with all required fields.
 
+        Selects exactly the fields the data center table shows instead of
+        prefetching every relationship of every data center.
+
         Args:
             branch: Branch name to query (default: "main")
 
@@ -124,48 +216,63 @@ class InfrahubClient:
             InfrahubAPIError: If API error occurs
         """
         try:
-            datacenters = self._client.filters(
-                kind="TopologyDataCenter",
-                branch=branch,
-                prefetch_relationships=True
-            )
+            query = """
+            query GetDataCenters {
+                TopologyDataCenter {
+                    edges {
+                        node {
+                            id
+                            name { value }
+                            description { value }
+                            strategy { value }
+                            location { node { id display_label } }
+                            design { node { id name { value } } }
+                        }
+                    }
+                }
+            }
+            """
 
-            result = []
-            for dc in datacenters:
+            result = self.execute_graphql(query, branch=branch)
+
+            datacenters = []
+            edges = result.get("TopologyDataCenter", {}).get("edges", [])
+
+            for edge in edges:
+                node = edge.get("node", {})
                 dc_dict = {
-                    "id": dc.id,
-                    "name": {"value": getattr(dc.name, "value", None)},
-                    "description": {"value": getattr(dc.description, "value", None) if hasattr(dc, "description") else None},
-                    "strategy": {"value": getattr(dc.strategy, "value", None) if hasattr(dc, "strategy") else None},
+                    "id": node.get("id"),
+                    "name": {"value": (node.get("name") or {}).get("value")},
+                    "description": {"value": (node.get("description") or {}).get("value")},
+                    "strategy": {"value": (node.get("strategy") or {}).get("value")},
                 }
 
                 # Add relationships if they exist
-                if hasattr(dc, "location") and dc.location.peer:
-                    dc_dict["location"] = {
-                        "node": {
-                            "id": dc.location.peer.id,
-                            "display_label": str(dc.location.peer)
-                        }
-                    }
+                location = (node.get("location") or {}).get("node")
+                if location:
+                    dc_dict["location"] = {"node": location}
 
-                if hasattr(dc, "design") and dc.design.peer:
-                    design_peer = dc.design.peer
+                design = (node.get("design") or {}).get("node")
+                if design:
                     dc_dict["design"] = {
                         "node": {
-                            "id": design_peer.id,
-                            "name": {"value": getattr(design_peer.name, "value", None) if hasattr(design_peer, "name") else None}
+                            "id": design.get("id"),
+                            "name": {"value": (design.get("name") or {}).get("value")},
                         }
                     }
 
-                result.append(dc_dict)
+                datacenters.append(dc_dict)
 
-            return result
+            return datacenters
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch datacenters: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch datacenters: {str(e)}") from e
 
     def get_colocation_centers(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch TopologyColocationCenter objects with all required fields.
 
+        Selects exactly the fields the colocation table shows instead of
+        prefetching every relationship of every colocation center.
+
         Args:
             branch: Branch name to query (default: "main")
 
@@ -177,37 +284,49 @@ class InfrahubClient:
             InfrahubAPIError: If API error occurs
         """
         try:
-            colocations = self._client.filters(
-                kind="TopologyColocationCenter",
-                branch=branch,
-                prefetch_relationships=True
-            )
+            query = """
+            query GetColocationCenters {
+                TopologyColocationCenter {
+                    edges {
+                        node {
+                            id
+                            name { value }
+                            description { value }
+                            location { node { id display_label } }
+                            provider { node { display_label } }
+                        }
+                    }
+                }
+            }
+            """
 
-            result = []
-            for colo in colocations:
+            result = self.execute_graphql(query, branch=branch)
+
+            colocations = []
+            edges = result.get("TopologyColocationCenter", {}).get("edges", [])
+
+            for edge in edges:
+                node = edge.get("node", {})
                 colo_dict = {
-                    "id": colo.id,
-                    "name": {"value": getattr(colo.name, "value", None)},
-                    "description": {"value": getattr(colo.description, "value", None) if hasattr(colo, "description") else None},
+                    "id": node.get("id"),
+                    "name": {"value": (node.get("name") or {}).get("value")},
+                    "description": {"value": (node.get("description") or {}).get("value")},
                 }
 
                 # Add relationships if they exist
-                if hasattr(colo, "location") and colo.location.peer:
-                    colo_dict["location"] = {
-                        "node": {
-                            "id": colo.location.peer.id,
-                            "display_label": str(colo.location.peer)
-                        }
-                    }
+                location = (node.get("location") or {}).get("node")
+                if location:
+                    colo_dict["location"] = {"node": location}
 
-                if hasattr(colo, "provider"):
-                    colo_dict["provider"] = {"value": getattr(colo.provider, "value", None)}
+                # Provider is a relationship; the table shows its label
+                provider = (node.get("provider") or {}).get("node") or {}
+                colo_dict["provider"] = {"value": provider.get("display_label")}
 
-                result.append(colo_dict)
+                colocations.append(colo_dict)
 
-            return result
+            return colocations
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch colocation centers: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch colocation centers: {str(e)}") from e
 
     def get_locations(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch LocationMetro objects.
@@ -240,7 +359,7 @@ class InfrahubClient:
 
             return result
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch locations: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch locations: {str(e)}") from e
 
     def get_providers(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch OrganizationProvider objects.
@@ -273,7 +392,7 @@ class InfrahubClient:
 
             return result
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch providers: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch providers: {str(e)}") from e
 
     def get_designs(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch DesignTopology objects.
@@ -306,7 +425,7 @@ class InfrahubClient:
 
             return result
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch designs: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch designs: {str(e)}") from e
 
     def get_active_prefixes(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch active IpamPrefix objects.
@@ -339,20 +458,56 @@ class InfrahubClient:
 
             result = self.execute_graphql(query, branch=branch)
 
-            prefixes = []
-            edges = result.get("IpamPrefix", {}).get("edges", [])
+            # The selection already has the returned shape; no need to rebuild it
+            return [edge.get("node", {}) for edge in result.get("IpamPrefix", {}).get("edges", [])]
+        except Exception as e:
+            raise InfrahubAPIError(f"Failed to fetch active prefixes: {str(e)}") from e
 
-            for edge in edges:
-                node = edge.get("node", {})
-                prefixes.append({
-                    "id": node.get("id"),
-                    "prefix": {"value": node.get("prefix", {}).get("value")},
-                    "status": {"value": node.get("status", {}).get("value")},
-                })
+    def get_form_bootstrap(self, branch: str = "main") -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch everything the Create DC form needs in a single GraphQL query.
 
-            return prefixes
-        except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch active prefixes: {str(e)}")
+        Combines the LocationMetro, OrganizationProvider, DesignTopology and
+        active IpamPrefix lookups into one document so the form loads with
+        one round trip instead of four.
+
+        Args:
+            branch: Branch name to query (default: "main")
+
+        Returns:
+            Dictionary with keys "locations", "providers", "designs" and
+            "active_prefixes", each shaped like the matching get_* method
+
+        Raises:
+            InfrahubGraphQLError: If GraphQL error occurs
+        """
+        query = """
+        query GetFormBootstrap {
+            LocationMetro {
+                edges { node { id name { value } } }
+            }
+            OrganizationProvider {
+                edges { node { id name { value } } }
+            }
+            DesignTopology {
+                edges { node { id name { value } } }
+            }
+            IpamPrefix(status__value: "active") {
+                edges { node { id prefix { value } status { value } } }
+            }
+        }
+        """
+
+        result = self.execute_graphql(query, branch=branch)
+
+        def nodes(kind: str) -> List[Dict[str, Any]]:
+            return [edge.get("node", {}) for edge in result.get(kind, {}).get("edges", [])]
+
+        return {
+            "locations": nodes("LocationMetro"),
+            "providers": nodes("OrganizationProvider"),
+            "designs": nodes("DesignTopology"),
+            "active_prefixes": nodes("IpamPrefix"),
+        }
 
     def get_proposed_changes(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch proposed changes for a branch.
@@ -385,7 +540,7 @@ class InfrahubClient:
 
             return result
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch proposed changes: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch proposed changes: {str(e)}") from e
 
     def execute_graphql(
         self,
@@ -415,7 +570,7 @@ class InfrahubClient:
             )
             return result
         except Exception as e:
-            raise InfrahubGraphQLError(f"GraphQL error: {str(e)}", [])
+            raise InfrahubGraphQLError(f"GraphQL error: {str(e)}", []) from e
 
     def create_branch(
         self, branch_name: str, from_branch: str = "main", sync_with_git: bool = False
@@ -445,7 +600,7 @@ class InfrahubClient:
                 "is_default": branch.is_default
             }
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to create branch: {str(e)}")
+            raise InfrahubAPIError(f"Failed to create branch: {str(e)}") from e
 
     def create_datacenter(
         self, branch: str, data: Dict[str, Any]
@@ -545,7 +700,7 @@ class InfrahubClient:
                 raise InfrahubAPIError(f"Failed to create datacenter: {dc_result}")
 
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to create datacenter: {str(e)}")
+            raise InfrahubAPIError(f"Failed to create datacenter: {str(e)}") from e
 
     def create_proposed_change(
         self, branch: str, name: str, description: str, destination_branch: str = "main"
@@ -581,7 +736,7 @@ class InfrahubClient:
                 "name": name
             }
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to create proposed change: {str(e)}")
+            raise InfrahubAPIError(f"Failed to create proposed change: {str(e)}") from e
 
     def get_proposed_change_url(self, pc_id: str) -> str:
         """Get the URL for a proposed change.
@@ -594,6 +749,37 @@ class InfrahubClient:
         """
         return f"{self.ui_url}/proposed-changes/{pc_id}"
 
+    def get_generator_statuses(self, object_id: str, branch: str) -> List[str]:
+        """Fetch the status of every generator instance targeting an object.
+
+        Args:
+            object_id: ID of the object the generators run against
+            branch: Branch name to query
+
+        Returns:
+            List of status values (e.g., "pending", "processing", "ready",
+            "error"); empty if no generator has been scheduled yet
+
+        Raises:
+            InfrahubGraphQLError: If GraphQL error occurs
+        """
+        query = """
+        query GetGeneratorStatus($ids: [ID]) {
+            CoreGeneratorInstance(object__ids: $ids) {
+                edges {
+                    node {
+                        status { value }
+                    }
+                }
+            }
+        }
+        """
+
+        result = self.execute_graphql(query, variables={"ids": [object_id]}, branch=branch)
+        edges = result.get("CoreGeneratorInstance", {}).get("edges", [])
+
+        return [edge.get("node", {}).get("status", {}).get("value") for edge in edges]
+
     def get_location_rows(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch LocationRow objects.
 
@@ -624,7 +810,7 @@ class InfrahubClient:
 
             return result
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch location rows: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch location rows: {str(e)}") from e
 
     def get_racks_by_row(self, row_id: str, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch LocationRack objects for a specific row.
@@ -678,7 +864,7 @@ class InfrahubClient:
 
             return racks
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch racks for row: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch racks for row: {str(e)}") from e
 
     def get_devices_by_rack(self, rack_id: str, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch DcimDevice objects for a specific rack.
@@ -690,15 +876,35 @@ class InfrahubClient:
         Returns:
             List of DcimDevice dictionaries with id, name, position, height, and device_type
 
+        Raises:
+            InfrahubConnectionError: If connection fails
+            InfrahubAPIError: If API error occurs
+        """
+        return self.get_devices_by_racks([rack_id], branch).get(rack_id, [])
+
+    def get_devices_by_racks(
+        self, rack_ids: List[str], branch: str = "main"
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch DcimDevice objects for several racks in a single query.
+
+        Args:
+            rack_ids: LocationRack IDs
+            branch: Branch name to query (default: "main")
+
+        Returns:
+            Dictionary mapping each rack ID to its list of DcimDevice dictionaries
+            (id, name, position, height, role and device_type). Racks without
+            devices are absent.
+
         Raises:
             InfrahubConnectionError: If connection fails
             InfrahubAPIError: If API error occurs
         """
         try:
-            # Use GraphQL to filter devices by location (rack)
+            # Use GraphQL to filter devices by location (any of the racks)
             query = """
-            query GetDevicesByRack($rack_id: ID!) {
-                DcimDevice(location__ids: [$rack_id]) {
+            query GetDevicesByRacks($rack_ids: [ID]) {
+                DcimDevice(location__ids: $rack_ids) {
                     edges {
                         node {
                             id
@@ -722,39 +928,19 @@ class InfrahubClient:
             }
             """
 
-            result = self.execute_graphql(query, {"rack_id": rack_id}, branch)
+            result = self.execute_graphql(query, {"rack_ids": list(rack_ids)}, branch)
 
-            devices = []
+            devices_by_rack: Dict[str, List[Dict[str, Any]]] = {}
             edges = result.get("DcimDevice", {}).get("edges", [])
 
             for edge in edges:
                 node = edge.get("node", {})
-                
-                # Get height from device_type
-                device_height = 1
-                device_type_name = None
-                device_type_node = node.get("device_type", {}).get("node")
-                if device_type_node:
-                    device_type_name = device_type_node.get("name", {}).get("value")
-                    device_height = device_type_node.get("height", {}).get("value", 1)
-                
-                device_dict = {
-                    "id": node.get("id"),
-                    "name": {"value": node.get("name", {}).get("value")},
-                    "position": {"value": node.get("position", {}).get("value")},
-                    "height": {"value": device_height},
-                    "role": {"value": node.get("role", {}).get("value")},
-                }
-
-                # Add device type if available
-                if device_type_name:
-                    device_dict["device_type"] = {"value": device_type_name}
+                rack_id = (node.get("location") or {}).get("node", {}).get("id")
+                devices_by_rack.setdefault(rack_id, []).append(self._rack_device_to_dict(node))
 
-                devices.append(device_dict)
-
-            return devices
+            return devices_by_rack
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch devices for rack: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch devices for racks: {str(e)}") from e
 
     def get_location_buildings(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch LocationBuilding objects.
@@ -786,7 +972,7 @@ class InfrahubClient:
 
             return result
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch location buildings: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch location buildings: {str(e)}") from e
 
     def get_pods_by_building(
         self, building_id: str, branch: str = "main"
@@ -838,7 +1024,7 @@ class InfrahubClient:
 
             return pods
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch pods for building: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch pods for building: {str(e)}") from e
 
     def get_racks_by_pod(
         self, pod_id: str, branch: str = "main"
@@ -890,7 +1076,7 @@ class InfrahubClient:
 
             return racks
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch racks for pod: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch racks for pod: {str(e)}") from e
 
     def get_devices_by_location(
         self,
@@ -969,7 +1155,7 @@ class InfrahubClient:
 
             return devices
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch devices for location: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch devices for location: {str(e)}") from e
 
     def get_interfaces_by_device(
         self,
@@ -1052,7 +1238,7 @@ class InfrahubClient:
 
             return interfaces
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch interfaces for device: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch interfaces for device: {str(e)}") from e
 
     def get_vlans_by_interface(
         self,
@@ -1113,7 +1299,7 @@ class InfrahubClient:
 
             return vlans
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch VLANs for interface: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch VLANs for interface: {str(e)}") from e
 
     def get_all_vlans(self, branch: str = "main") -> List[Dict[str, Any]]:
         """Fetch all InterfaceVirtual (VLAN) objects.
@@ -1129,10 +1315,13 @@ class InfrahubClient:
             InfrahubAPIError: If API error occurs
         """
         try:
+            # Every VLAN on the branch usually spans several pages; fetch them
+            # concurrently
             vlans = self._client.filters(
                 kind="InterfaceVirtual",
                 branch=branch,
-                prefetch_relationships=False
+                prefetch_relationships=False,
+                parallel=True,
             )
 
             result = []
@@ -1147,7 +1336,7 @@ class InfrahubClient:
 
             return result
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to fetch VLANs: {str(e)}")
+            raise InfrahubAPIError(f"Failed to fetch VLANs: {str(e)}") from e
 
     def assign_vlan_to_interface(
         self,
@@ -1205,7 +1394,39 @@ class InfrahubClient:
                 raise InfrahubAPIError(f"VLAN assignment mutation failed: {result}")
 
         except Exception as e:
-            raise InfrahubAPIError(f"Failed to assign VLAN to interface: {str(e)}")
+            raise InfrahubAPIError(f"Failed to assign VLAN to interface: {str(e)}") from e
+
+    def _rack_device_to_dict(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a DcimDevice GraphQL node to the dictionary used by rack diagrams.
+
+        Args:
+            node: DcimDevice node from a GraphQL response
+
+        Returns:
+            Device dictionary with id, name, position, height, role and, when
+            known, device_type
+        """
+        # Get height from device_type
+        device_height = 1
+        device_type_name = None
+        device_type_node = node.get("device_type", {}).get("node")
+        if device_type_node:
+            device_type_name = device_type_node.get("name", {}).get("value")
+            device_height = device_type_node.get("height", {}).get("value", 1)
+
+        device_dict = {
+            "id": node.get("id"),
+            "name": {"value": node.get("name", {}).get("value")},
+            "position": {"value": node.get("position", {}).get("value")},
+            "height": {"value": device_height},
+            "role": {"value": node.get("role", {}).get("value")},
+        }
+
+        # Add device type if available
+        if device_type_name:
+            device_dict["device_type"] = {"value": device_type_name}
+
+        return device_dict
 
     def _sdk_object_to_dict(self, obj: Any) -> Dict[str, Any]:
         """Convert an SDK object to a dictionary.
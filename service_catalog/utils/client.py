@@ -0,0 +1,28 @@
+"""Shared Infrahub API client for the Infrahub Service Catalog pages."""
+
+from typing import Optional
+
+import streamlit as st
+
+from .api import InfrahubClient
+
+
+@st.cache_resource(show_spinner=False)
+def get_client(
+    url: str, api_token: Optional[str], ui_url: Optional[str] = None
+) -> InfrahubClient:
+    """Return a process-wide InfrahubClient for the given connection settings.
+
+    The underlying SDK client (its schema cache and HTTP connection pool) is
+    built once and reused across reruns, pages and sessions instead of on
+    every script run. Changing any of the settings yields a separate client.
+
+    Args:
+        url: Infrahub base URL
+        api_token: Optional API token
+        ui_url: Optional UI URL for browser links
+
+    Returns:
+        Shared InfrahubClient instance
+    """
+    return InfrahubClient(url, api_token=api_token, ui_url=ui_url)
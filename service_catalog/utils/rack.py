@@ -1,5 +1,6 @@
 """Rack visualization utilities for the Infrahub Service Catalog."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from .ui import get_device_color, truncate_device_name
@@ -45,13 +46,10 @@ def create_rack_unit_map(
         unit: None for unit in range(1, rack_height + 1)
     }
 
-    # Sort devices by position to handle overlaps consistently
-    sorted_devices = sorted(
-        devices,
-        key=lambda d: d.get("position", {}).get("value", 0) or 0
-    )
-
-    for device in sorted_devices:
+    # Read position and height once per device, then sort by position to
+    # handle overlaps consistently
+    placements = []
+    for device in devices:
         position_value = device.get("position", {}).get("value")
         height_value = device.get("height", {}).get("value", 1)
 
@@ -63,9 +61,13 @@ def create_rack_unit_map(
         if height_value is None or height_value < 1:
             height_value = 1
 
+        placements.append((int(position_value), int(height_value), device))
+
+    placements.sort(key=lambda placement: placement[0])
+
+    for start_unit, height_value, device in placements:
         # Calculate which units this device occupies
-        start_unit = int(position_value)
-        end_unit = start_unit + int(height_value) - 1
+        end_unit = start_unit + height_value - 1
 
         # Skip if device position is outside rack bounds
         if start_unit > rack_height or end_unit < 1:
@@ -106,7 +108,7 @@ def create_rack_unit_map(
 
 
 
-def generate_rack_html(rack: Dict[str, Any], devices: List[Dict[str, Any]], base_url: str = "http://localhost:8000", branch: str = "main", label_mode: str = "Hostname") -> str:
+def generate_rack_html(rack: Dict[str, Any], devices: List[Dict[str, Any]], base_url: str = "http://localhost:8000", branch: str = "main", label_mode: str = "Hostname", include_css: bool = True) -> str:
     """Generate HTML for rack diagram visualization.
 
     Creates a NetBox-style rack diagram with numbered units and positioned devices.
@@ -120,27 +122,28 @@ def generate_rack_html(rack: Dict[str, Any], devices: List[Dict[str, Any]], base
         base_url: Base URL of Infrahub instance for generating device links
         branch: Branch name for device links
         label_mode: Display mode for device labels ("Hostname" or "Device Type")
+        include_css: Embed the rack stylesheet (disable when the caller emits it
+            once for several racks)
 
     Returns:
-        HTML string for rack diagram with embedded CSS
+        HTML string for rack diagram, with embedded CSS unless disabled
     """
     rack_height = rack.get("height", {}).get("value", 42)
     rack_name = rack.get("name", {}).get("value", "Unknown Rack")
 
-    # Create rack unit map
-    rack_units = create_rack_unit_map(rack_height, devices)
+    if devices:
+        # Create rack unit map
+        rack_units = create_rack_unit_map(rack_height, devices)
 
-    # Generate CSS styles
-    css = _generate_rack_css()
-
-    # Generate rack units HTML
-    units_html = generate_rack_units_html(rack_units, rack_height, base_url, branch, label_mode)
+        # Generate rack units HTML
+        units_html = generate_rack_units_html(rack_units, rack_height, base_url, branch, label_mode)
+    else:
+        # Empty racks only differ by height
+        units_html = _empty_rack_units_html(rack_height)
 
     # Combine into complete HTML
-    html = f"""<style>
-{css}
-</style>
-<div class="rack-container">
+    style_html = f"<style>\n{_generate_rack_css()}\n</style>\n" if include_css else ""
+    html = f"""{style_html}<div class="rack-container">
     <div class="rack-header">{rack_name}</div>
     <div class="rack-body">
 {units_html}
@@ -150,6 +153,52 @@ def generate_rack_html(rack: Dict[str, Any], devices: List[Dict[str, Any]], base
     return html
 
 
+def generate_rack_grid_html(
+    racks: List[Dict[str, Any]],
+    rack_devices: Dict[str, List[Dict[str, Any]]],
+    base_url: str = "http://localhost:8000",
+    branch: str = "main",
+    label_mode: str = "Hostname",
+    columns: int = 4,
+) -> str:
+    """Generate HTML for a grid of rack diagrams.
+
+    All racks share one stylesheet and one wrapper, so the whole grid can be
+    displayed with a single markdown element. Each rack is followed by its
+    device count.
+
+    Args:
+        racks: LocationRack objects, in display order
+        rack_devices: Map of rack ID to the DcimDevice objects in that rack
+        base_url: Base URL of Infrahub instance for generating device links
+        branch: Branch name for device links
+        label_mode: Display mode for device labels ("Hostname" or "Device Type")
+        columns: Maximum number of racks per grid row
+
+    Returns:
+        HTML string for the rack grid with embedded CSS
+    """
+    num_cols = max(1, min(len(racks), columns))
+    cells = []
+
+    for rack in racks:
+        devices = rack_devices.get(rack["id"], [])
+        rack_html = generate_rack_html(rack, devices, base_url, branch, label_mode, include_css=False)
+        caption = f"{len(devices)} device(s)" if devices else "Empty rack"
+        cells.append(f"""<div class="rack-cell">
+{rack_html}
+<div class="rack-caption">{caption}</div>
+</div>""")
+
+    cells_html = "\n".join(cells)
+    return f"""<style>
+{_generate_rack_css()}
+</style>
+<div class="rack-grid" style="grid-template-columns: repeat({num_cols}, minmax(0, 1fr));">
+{cells_html}
+</div>"""
+
+
 def generate_rack_units_html(
     rack_units: Dict[int, Optional[Dict[str, Any]]], rack_height: int, base_url: str, branch: str, label_mode: str = "Hostname"
 ) -> str:
@@ -190,6 +239,19 @@ def generate_rack_units_html(
     return "\n".join(units_html_parts)
 
 
+@lru_cache(maxsize=16)
+def _empty_rack_units_html(rack_height: int) -> str:
+    """Generate HTML for the units of a rack with no devices.
+
+    Args:
+        rack_height: Total rack height
+
+    Returns:
+        HTML string for all rack units, all empty
+    """
+    return "\n".join(_generate_empty_unit_html(unit_num) for unit_num in range(rack_height, 0, -1))
+
+
 def _generate_empty_unit_html(unit_num: int) -> str:
     """Generate HTML for an empty rack unit.
 
@@ -274,6 +336,17 @@ def _generate_rack_css() -> str:
         CSS string with all rack diagram styles
     """
     return """
+    .rack-grid {
+        display: grid;
+        gap: 1rem;
+    }
+
+    .rack-caption {
+        margin: 0 10px;
+        font-size: 14px;
+        color: rgba(49, 51, 63, 0.6);
+    }
+
     .rack-container {
         border: 2px solid #333;
         border-radius: 4px;